@@ -10,7 +10,7 @@ import datetime
 import uuid
 
 from config import Config
-from utils.git_utils import run_git_command, get_branches, get_current_branch
+from utils.git_utils import run_git_command, get_branches
 
 
 class BranchRefreshApp:
@@ -379,9 +379,10 @@ class BranchRefreshApp:
         try:
             self.log_message(f"Refreshing branch: {branch}")
             
-            # Check if branch has tracking remote
-            from utils.git_utils import get_tracking_branch, has_uncommitted_changes
-            tracking_branch = get_tracking_branch(repo_path, branch)
+            # Check if branch has tracking remote (one git call also gives the current branch)
+            from utils.git_utils import get_repo_snapshot, has_uncommitted_changes
+            snapshot = get_repo_snapshot(repo_path)
+            tracking_branch = snapshot['tracking'].get(branch)
             
             if not tracking_branch:
                 self.log_message(f"  ⚠ SKIPPED: No tracking branch found for '{branch}'")
@@ -393,8 +394,7 @@ class BranchRefreshApp:
                 return "skipped"
             
             # Check if this is the current branch
-            current_branch = get_current_branch(repo_path)
-            is_current = (current_branch == branch)
+            is_current = (snapshot['current'] == branch)
             
             temp_branch = None
             
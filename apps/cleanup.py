@@ -127,41 +127,23 @@ class BranchCleanerApp:
         self.branches_info.clear()
         now = datetime.datetime.now(datetime.timezone.utc)
         
-        # Collect all candidates: name -> {'local': ref, 'remote': ref}
+        # Collect all candidates: name -> newest commit timestamp across the local and origin branch.
+        # One for-each-ref call returns every ref with its date, instead of a commit lookup per ref.
         candidates = {}
-
-        # 1. Local branches
-        for head in self.repo.heads:
-            if head.name.startswith(prefix):
-                if head.name not in candidates:
-                    candidates[head.name] = {}
-                candidates[head.name]['local'] = head
-
-        # 2. Remote branches (origin)
-        if 'origin' in self.repo.remotes:
-            for ref in self.repo.remotes.origin.refs:
-                # ref.name is typically "origin/feature/..."
-                remote_name = ref.name
-                if remote_name.startswith("origin/"):
-                    short_name = remote_name[7:]  # strip "origin/"
-                    if short_name.startswith(prefix):
-                        if short_name not in candidates:
-                            candidates[short_name] = {}
-                        candidates[short_name]['remote'] = ref
-
-        for name, refs in candidates.items():
-            # Determine most recent commit date between local and remote
-            timestamps = []
-            if 'local' in refs:
-                timestamps.append(refs['local'].commit.committed_date)
-            if 'remote' in refs:
-                timestamps.append(refs['remote'].commit.committed_date)
-            
-            if not timestamps:
-                continue
-            
-            # Use the newest timestamp to avoid deleting a branch that was just updated on one side
-            max_ts = max(timestamps)
+        refs_output = self.repo.git.for_each_ref(
+            "--format=%(committerdate:unix) %(refname)", "refs/heads/", "refs/remotes/origin/"
+        )
+        for line in refs_output.splitlines():
+            timestamp, _, refname = line.partition(" ")
+            if refname.startswith("refs/heads/"):
+                name = refname[len("refs/heads/"):]
+            else:
+                name = refname[len("refs/remotes/origin/"):]
+            if name.startswith(prefix):
+                # Use the newest timestamp to avoid deleting a branch that was just updated on one side
+                candidates[name] = max(candidates.get(name, 0), int(timestamp))
+
+        for name, max_ts in candidates.items():
             commit_date = datetime.datetime.fromtimestamp(max_ts, datetime.timezone.utc)
             age_days = (now - commit_date).days
             
@@ -0,0 +1,76 @@
+"""
+Long-lived `git cat-file --batch` reader.
+Answers repeated commit lookups from one git process instead of spawning git per query.
+"""
+
+import subprocess
+import sys
+import threading
+
+
+class GitBatch:
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+        self._lock = threading.Lock()
+        self._process = None
+
+    def _ensure_process(self):
+        if self._process is None or self._process.poll() is not None:
+            creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch=%(objectname) %(objecttype) %(objectsize)"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                creationflags=creation_flags
+            )
+        return self._process
+
+    def read_object(self, rev):
+        """
+        Returns (object_type, raw_bytes) for any revision git can resolve (SHA, branch name, ...).
+        Raises ValueError if the object does not exist.
+        """
+        with self._lock:
+            process = self._ensure_process()
+            process.stdin.write(rev.encode('utf-8') + b"\n")
+            process.stdin.flush()
+
+            header = process.stdout.readline().decode('utf-8', errors='ignore').split()
+            if len(header) != 3:
+                # "<rev> missing" or "<rev> ambiguous"
+                raise ValueError(f"Cannot read object '{rev}': {' '.join(header) or 'no response'}")
+            _, object_type, size = header
+            data = process.stdout.read(int(size) + 1)  # Content is followed by a newline
+            return object_type, data[:-1]
+
+    def get_commit(self, rev):
+        """Returns (subject, body) of a commit, matching `git log --pretty=%s` and `%b`."""
+        object_type, data = self.read_object(rev)
+        if object_type != "commit":
+            raise ValueError(f"'{rev}' is a {object_type}, not a commit")
+
+        text = data.decode('utf-8', errors='ignore')
+        _, _, message = text.partition("\n\n")
+        subject, _, body = message.strip("\n").partition("\n\n")
+        # %s joins the first paragraph into a single line
+        subject = " ".join(line.strip() for line in subject.splitlines())
+        return subject, body.strip("\n")
+
+    def close(self):
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+            self._process = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -7,12 +7,22 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import subprocess
 import os
+import re
 import shlex
 import uuid
 import threading
+from concurrent.futures import Future
 
 from config import Config
 from ai.gemini_client import GeminiClient
+from utils.thread_utils import DaemonExecutor
+
+# Shared worker pool for git lookups that can overlap with dialogs awaiting user input.
+# Daemon workers, so a slow git call never holds up closing the app.
+_PREFETCH_POOL = DaemonExecutor(max_workers=4, thread_name_prefix="propagator")
+
+# Extracts the subject from a commit list line: "<hash>|<subject> (<author>)"
+_MSG_RE = re.compile(r'\|(?P<msg>.*?)\s*(?:\([^)]*\))?\s*$')
 
 
 class GitPropagatorApp:
@@ -179,11 +189,16 @@ class GitPropagatorApp:
         self.log_text.config(state=tk.DISABLED)
         self.parent.update_idletasks()
 
-    def run_git_command(self, command, check=True):
+    def run_git_command(self, command, check=True, quiet=False):
+        """
+        Run a git command in the selected repo. quiet=True skips logging (for worker threads).
+        command is a string (shlex-split) or an argument list passed through as-is.
+        """
         if not self.repo_path.get(): 
             raise ValueError("Repository path not set.")
-        command_parts = ["git"] + shlex.split(command)
-        self.log(f"> {' '.join(command_parts)}")
+        command_parts = ["git"] + (shlex.split(command) if isinstance(command, str) else list(command))
+        if not quiet:
+            self.log(f"> {' '.join(command_parts)}")
         
         # Hide console window on Windows
         import sys
@@ -200,14 +215,60 @@ class GitPropagatorApp:
             errors='ignore',
             creationflags=creation_flags
         )
-        if process.stdout: 
+        if process.stdout and not quiet: 
             self.log(process.stdout.strip())
-        if process.stderr: 
+        if process.stderr and not quiet: 
             self.log(f"ERROR: {process.stderr.strip()}")
         if check: 
             process.check_returncode()
         return process.stdout.strip()
     
+    def run_git_streaming(self, command, on_line=None, check=True):
+        """
+        Run a long git command (cherry-pick, push) and forward each output line as it arrives.
+        stderr is merged into stdout so progress and errors are logged in order.
+        Progress meters redraw with '\r'; only the final state of each line is forwarded.
+        """
+        if not self.repo_path.get():
+            raise ValueError("Repository path not set.")
+        on_line = on_line or self.log
+        command_parts = ["git"] + shlex.split(command)
+        self.log(f"> {' '.join(command_parts)}")
+        
+        import sys
+        creation_flags = 0
+        if sys.platform == 'win32':
+            creation_flags = subprocess.CREATE_NO_WINDOW
+        
+        with subprocess.Popen(
+            command_parts,
+            cwd=self.repo_path.get(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            creationflags=creation_flags
+        ) as process:
+            pending = b""
+            while True:
+                # read1 returns whatever has arrived, instead of waiting for a full buffer
+                chunk = process.stdout.read1(4096)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    self._emit_progress_line(line, on_line)
+            self._emit_progress_line(pending, on_line)
+            returncode = process.wait()
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command_parts)
+        return returncode
+    
+    @staticmethod
+    def _emit_progress_line(line, on_line):
+        """Forward the last '\r'-separated update of a line, e.g. "Writing objects: 100% ..., done."."""
+        updates = [update for update in line.split(b"\r") if update.strip()]
+        if updates:
+            on_line(updates[-1].decode('utf-8', errors='ignore').rstrip())
+    
     def is_merge_commit(self, commit_hash):
         """Check if a commit is a merge commit (has multiple parents)."""
         try:
@@ -475,7 +536,9 @@ class GitPropagatorApp:
 
             self.log(f"\nLoading last {max_commits} commits for branch '{branch_name}'...")
             # Include parent info in log format
-            log_output = self.run_git_command(f"log {branch_name} --pretty=format:'%h|%P|%s (%an)' -n {max_commits}")
+            log_output = self.run_git_command(
+                ["log", branch_name, "--pretty=format:%h|%P|%s (%an)", "-n", str(max_commits)]
+            )
             
             show_merge = self.show_merge_commits_var.get()
             
@@ -658,11 +721,97 @@ class GitPropagatorApp:
         else:
             combo.set('')
 
-    def prompt_merge_parent_selection(self, commit_hash):
+    def _snapshot_local_refs(self):
+        """
+        Read every local branch and its tip in a single for-each-ref call.
+        Returns: {branch_name: tip_sha}
+        """
+        output = self.run_git_command("for-each-ref '--format=%(refname:short) %(objectname)' refs/heads/", quiet=True)
+        refs = {}
+        for line in output.splitlines():
+            name, _, sha = line.rpartition(' ')
+            if name:
+                refs[name] = sha
+        return refs
+
+    def _missing_target_branches(self, target_branches):
+        """Return the target branches that do not exist locally, before any checkout happens."""
+        try:
+            refs = self._snapshot_local_refs()
+        except subprocess.CalledProcessError as e:
+            self.log(f"WARNING: Could not read local branches: {e}")
+            return []
+        return [branch for branch in target_branches if branch not in refs]
+
+    def _fetch_parent_details(self, commit_hash):
+        """
+        Look up the parents of a commit together with their one-line subjects.
+        Runs quietly so it can be executed on a worker thread.
+        Returns: list of (parent_hash, subject) tuples
+        """
+        try:
+            parents_output = self.run_git_command(f"log --pretty=%P -n 1 {commit_hash}", quiet=True)
+        except subprocess.CalledProcessError:
+            return []
+        parents = parents_output.split() if parents_output else []
+        if not parents:
+            return []
+        
+        # One call for all parent subjects; --no-walk=unsorted keeps the parent order
+        try:
+            subjects = self.run_git_command(f"log --no-walk=unsorted --oneline {' '.join(parents)}", quiet=True).splitlines()
+        except subprocess.CalledProcessError:
+            subjects = []
+        if len(subjects) != len(parents):
+            subjects = [f"{parent} (unable to fetch details)" for parent in parents]
+        return list(zip(parents, subjects))
+
+    def _prefetch_parent_details(self, commits):
+        """Start background lookups of parent details for every merge commit in `commits`."""
+        return {
+            commit_hash: _PREFETCH_POOL.submit(self._fetch_parent_details, commit_hash)
+            for commit_hash in dict.fromkeys(commits)
+            if self.commit_data.get(commit_hash, {}).get('is_merge', False)
+        }
+
+    def _wait_for_future(self, future):
+        """Keep the Tk event loop responsive until `future` resolves, then return its result."""
+        if not future.done():
+            done_var = tk.BooleanVar(master=self.parent, value=False)
+            future.add_done_callback(lambda f: self.parent.after(0, done_var.set, True))
+            self.parent.wait_variable(done_var)
+        return future.result()
+
+    def _gather_merge_parents(self, commits):
+        """
+        Prompt once per unique merge commit in `commits` for the parent to follow.
+        Returns: {commit_hash: parent_index}, or None if the user cancelled any prompt
+        """
+        merge_parents = {}
+        # Look up all parents up front so later dialogs are ready while the user answers the first
+        parent_details = self._prefetch_parent_details(commits)
+        for commit_hash, details_future in parent_details.items():
+            parent = self.prompt_merge_parent_selection(commit_hash, self._wait_for_future(details_future))
+            if parent is None:
+                return None
+            merge_parents[commit_hash] = parent
+        return merge_parents
+
+    def prompt_merge_parent_selection(self, commit_hash, parent_details=None):
         """Prompt user to select which parent to use for cherry-picking a merge commit."""
-        parents = self.get_commit_parents(commit_hash)
-        if len(parents) < 2:
-            return None
+        return self._wait_for_future(self.prompt_merge_parent_selection_async(commit_hash, parent_details))
+
+    def prompt_merge_parent_selection_async(self, commit_hash, parent_details=None):
+        """
+        Show the merge parent dialog without blocking.
+        Returns: Future resolved with the 1-based parent index, or None if cancelled
+        """
+        future = Future()
+        if parent_details is None:
+            parent_details = self._fetch_parent_details(commit_hash)
+        if len(parent_details) < 2:
+            future.set_result(None)
+            return future
         
         dialog = tk.Toplevel(self.parent)
         dialog.title("Select Merge Parent")
@@ -678,13 +827,7 @@ class GitPropagatorApp:
         
         parent_var = tk.IntVar(value=1)
         
-        for idx, parent in enumerate(parents, 1):
-            # Get parent commit subject
-            try:
-                parent_subject = self.run_git_command(f"log --oneline -n 1 {parent}")
-            except subprocess.CalledProcessError:
-                parent_subject = f"{parent} (unable to fetch details)"
-            
+        for idx, (parent, parent_subject) in enumerate(parent_details, 1):
             label_text = f"Parent {idx}: {parent_subject}"
             if idx == 1:
                 label_text += " (usually target/main branch)"
@@ -693,22 +836,25 @@ class GitPropagatorApp:
             
             ttk.Radiobutton(main_frame, text=label_text, variable=parent_var, value=idx).pack(anchor="w", pady=5)
         
-        result = {'selection': None}
-        
         def on_ok():
-            result['selection'] = parent_var.get()
+            if not future.done():
+                future.set_result(parent_var.get())
             dialog.destroy()
         
         def on_cancel():
+            if not future.done():
+                future.set_result(None)
             dialog.destroy()
         
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
         ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT)
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+        # Resolve the future even if the dialog is torn down some other way
+        dialog.bind("<Destroy>", lambda e: e.widget is dialog and not future.done() and future.set_result(None))
         
-        dialog.wait_window()
-        return result['selection']
+        return future
     
     def _create_branch_action(self, dialog, name, from_origin, remote_branch):
         if not name:
@@ -756,6 +902,9 @@ class GitPropagatorApp:
         if not selected_branch_indices: 
             return messagebox.showwarning("Warning", "Please select target branches.")
         target_branches = [self.target_branch_listbox.get(i) for i in selected_branch_indices]
+        missing = self._missing_target_branches(target_branches)
+        if missing:
+            return messagebox.showerror("Missing Branches", "These target branches do not exist locally:\n\n- " + "\n- ".join(missing))
 
         # Single commit - existing logic
         if len(selected_indices) == 1:
@@ -784,10 +933,10 @@ class GitPropagatorApp:
                         cherry_pick_cmd = f"cherry-pick {commit_hash}"
                         if merge_parent:
                             cherry_pick_cmd = f"cherry-pick -m {merge_parent} {commit_hash}"
-                        self.run_git_command(cherry_pick_cmd)
+                        self.run_git_streaming(cherry_pick_cmd)
                         if self.push_changes_var.get():
                             self.log(f"Pushing changes for {branch} to origin...")
-                            self.run_git_command(f"push -u origin {branch}")
+                            self.run_git_streaming(f"push --progress -u origin {branch}")
                         self.log(f"✅ Successfully propagated to {branch}")
                     except subprocess.CalledProcessError:
                         self.log(f"🛑 FAILED on {branch}. A merge conflict likely occurred.")
@@ -819,13 +968,9 @@ class GitPropagatorApp:
                 commits.reverse()
                 
                 # Check for merge commits and prompt for parents
-                merge_parents = {}  # {commit_hash: parent_index}
-                for commit_hash in commits:
-                    if self.commit_data.get(commit_hash, {}).get('is_merge', False):
-                        parent = self.prompt_merge_parent_selection(commit_hash)
-                        if parent is None:
-                            return self.log("Operation cancelled - no parent selected for merge commit.")
-                        merge_parents[commit_hash] = parent
+                merge_parents = self._gather_merge_parents(commits)
+                if merge_parents is None:
+                    return self.log("Operation cancelled - no parent selected for merge commit.")
                 if not messagebox.askyesno("Confirm Action", f"Cherry-pick {len(commits)} commits individually onto:\n\n- {', '.join(target_branches)}\n\nProceed?"):
                     return self.log("Operation cancelled.")
                 
@@ -842,10 +987,10 @@ class GitPropagatorApp:
                                 cherry_pick_cmd = f"cherry-pick {commit_hash}"
                                 if commit_hash in merge_parents:
                                     cherry_pick_cmd = f"cherry-pick -m {merge_parents[commit_hash]} {commit_hash}"
-                                self.run_git_command(cherry_pick_cmd)
+                                self.run_git_streaming(cherry_pick_cmd)
                             if self.push_changes_var.get():
                                 self.log(f"Pushing changes for {branch} to origin...")
-                                self.run_git_command(f"push -u origin {branch}")
+                                self.run_git_streaming(f"push --progress -u origin {branch}")
                             self.log(f"✅ Successfully propagated all commits to {branch}")
                         except subprocess.CalledProcessError:
                             self.log(f"🛑 FAILED on {branch}. A merge conflict likely occurred.")
@@ -866,6 +1011,14 @@ class GitPropagatorApp:
         Shows dialog for editing the combined commit message.
         Returns: message string or None if cancelled
         """
+        return self._wait_for_future(self.prompt_combined_commit_message_async(indices))
+
+    def prompt_combined_commit_message_async(self, indices):
+        """
+        Shows the combined commit message dialog without blocking.
+        Returns: Future resolved with the message string, or None if cancelled
+        """
+        future = Future()
         popup = tk.Toplevel(self.parent)
         popup.title("Combined Commit Message")
         popup.transient(self.parent)
@@ -895,11 +1048,9 @@ class GitPropagatorApp:
         for idx in indices:
             commit_line = self.commit_listbox.get(idx)
             # Extract message part (between | and (author))
-            if '|' in commit_line:
-                msg_part = commit_line.split('|')[1]
-                if '(' in msg_part:
-                    msg_part = msg_part[:msg_part.rfind('(')].strip()
-                suggested_messages.append(msg_part)
+            match = _MSG_RE.search(commit_line)
+            if match:
+                suggested_messages.append(match.group('msg'))
         
         suggested = "\n\n".join(suggested_messages)
         
@@ -908,22 +1059,24 @@ class GitPropagatorApp:
         message_text.insert("1.0", suggested)
         message_text.focus_set()
         
-        result = {'message': None}
-        
         def on_ok():
-            result['message'] = message_text.get("1.0", tk.END).strip()
+            if not future.done():
+                future.set_result(message_text.get("1.0", tk.END).strip())
             popup.destroy()
         
         def on_cancel():
+            if not future.done():
+                future.set_result(None)
             popup.destroy()
         
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill=tk.X)
         ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT)
+        popup.protocol("WM_DELETE_WINDOW", on_cancel)
+        popup.bind("<Destroy>", lambda e: e.widget is popup and not future.done() and future.set_result(None))
         
-        popup.wait_window()
-        return result['message']
+        return future
 
     def combine_and_propagate(self, indices, message, targets):
         """
@@ -947,14 +1100,10 @@ class GitPropagatorApp:
             commits_reversed = list(reversed(commits))  # Oldest first
             
             # Check for merge commits and prompt for parents
-            merge_parents = {}  # {commit_hash: parent_index}
-            for commit_hash in commits_reversed:
-                if self.commit_data.get(commit_hash, {}).get('is_merge', False):
-                    parent = self.prompt_merge_parent_selection(commit_hash)
-                    if parent is None:
-                        self.log("Operation cancelled - no parent selected for merge commit.")
-                        return
-                    merge_parents[commit_hash] = parent
+            merge_parents = self._gather_merge_parents(commits_reversed)
+            if merge_parents is None:
+                self.log("Operation cancelled - no parent selected for merge commit.")
+                return
             
             self.log(f"Commits to combine (oldest first): {', '.join(commits_reversed)}")
             
@@ -976,7 +1125,7 @@ class GitPropagatorApp:
                 cherry_pick_cmd = f"cherry-pick {commit}"
                 if commit in merge_parents:
                     cherry_pick_cmd = f"cherry-pick -m {merge_parents[commit]} {commit}"
-                self.run_git_command(cherry_pick_cmd)
+                self.run_git_streaming(cherry_pick_cmd)
             
             # Squash: reset soft to base, then commit with new message
             self.log("Squashing commits...")
@@ -992,10 +1141,10 @@ class GitPropagatorApp:
                 self.log(f"\n--- Applying combined commit to branch: {branch} ---")
                 try:
                     self.run_git_command(f"checkout {branch}")
-                    self.run_git_command(f"cherry-pick {combined_hash}")
+                    self.run_git_streaming(f"cherry-pick {combined_hash}")
                     if self.push_changes_var.get():
                         self.log(f"Pushing changes for {branch} to origin...")
-                        self.run_git_command(f"push -u origin {branch}")
+                        self.run_git_streaming(f"push --progress -u origin {branch}")
                     self.log(f"✅ Successfully propagated to {branch}")
                 except subprocess.CalledProcessError:
                     self.log(f"🛑 FAILED on {branch}. A merge conflict likely occurred.")
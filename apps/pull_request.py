@@ -10,20 +10,129 @@ import subprocess
 import os
 import shutil
 import sys
+import threading
 
 from config import Config
 from ai.gemini_client import GeminiClient
+from apps.git_batch import GitBatch
+from utils.thread_utils import DaemonExecutor
+
+# Hide console windows for git/gh subprocesses on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+# Prefix marking the start of each commit record in the preview's NUL-delimited git log output
+COMMIT_MARKER = "\x01"
+
+# The Gemini client only keeps the first 8000 characters, so never read much more than that
+MAX_DIFF_BYTES = 16 * 1024
+
+# Delay before filtering/previewing, so bursts of keystrokes or selections run once
+DEBOUNCE_MS = 150
+
+# How often buffered log lines are written to the log widget
+LOG_FLUSH_MS = 50
+
+# Output kept from streamed commands; gh prints the PR URL on its last line
+STREAM_TAIL_CHARS = 4096
+
+def _list_refs(repo_path):
+    """
+    Lists local and origin branch names, their tip SHAs, and the current branch,
+    all from a single for-each-ref.
+    Returns: (sorted tuple of branch names, current branch or "", tuple of (branch, sha) pairs)
+    """
+    refs_output = subprocess.run(
+        ["git", "for-each-ref", "--format=%(HEAD)\t%(refname)\t%(symref)\t%(objectname)", "refs/heads/", "refs/remotes/origin/"],
+        cwd=repo_path, capture_output=True, text=True, encoding='utf-8', errors='ignore',
+        creationflags=_CREATION_FLAGS, check=True
+    ).stdout
+    tips = {}
+    remote_tips = {}
+    # Stays empty on a detached HEAD, where no branch is marked with '*'
+    current_branch = ""
+    for line in refs_output.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 4 or parts[2]:
+            continue  # Skip symbolic refs like origin/HEAD
+        head_marker, refname, _, sha = parts
+        if refname.startswith("refs/heads/"):
+            tips[refname[len("refs/heads/"):]] = sha
+            if head_marker == "*":
+                current_branch = refname[len("refs/heads/"):]
+        elif refname.startswith("refs/remotes/origin/"):
+            remote_tips[refname[len("refs/remotes/origin/"):]] = sha
+    # A bare branch name resolves to the local branch first, like `git log <branch>`
+    tips = {**remote_tips, **tips}
+    return tuple(sorted(tips)), current_branch, tuple(tips.items())
+
+
+def _parse_preview_log(log_output):
+    """
+    Parses `git log -z` output produced with the COMMIT_MARKER format.
+    Returns: list of (hash, author, date, subject)
+    """
+    commits = []
+    tokens = iter(log_output.split("\0"))
+    for token in tokens:
+        if token.startswith(COMMIT_MARKER):
+            short_hash = token[len(COMMIT_MARKER):]
+            author = next(tokens, "")
+            date = next(tokens, "")
+            subject = next(tokens, "")
+            commits.append((short_hash, author, date, subject))
+    return commits
+
+
+def _parse_numstat(diff_output):
+    """
+    Parses `git diff -z --numstat` output.
+    Returns: {path: [added, deleted] or None for binary}
+    """
+    files = {}
+    tokens = iter(diff_output.split("\0"))
+    for entry in tokens:
+        if not entry:
+            continue
+        added, _, rest = entry.partition("\t")
+        deleted, _, fpath = rest.partition("\t")
+        if not fpath:
+            # Renames leave the path empty and emit the old and new paths as separate fields
+            next(tokens, "")
+            fpath = next(tokens, "")
+        # Binary files report "-" for both counts
+        if added == "-" or deleted == "-":
+            files[fpath] = None
+        else:
+            files[fpath] = [int(added), int(deleted)]
+    return files
 
 
 class PullRequestApp:
+    # (custom gh path preference, resolved gh executable), shared by all instances
+    _gh_path_cache = None
+
     def __init__(self, parent):
         self.parent = parent
         self.repo_path = tk.StringVar()
         self.all_branches = []
+        self._all_branches_lower = []
+        self._last_filter = {}
+        self._filter_after_id = {'source': None, 'target': None}
+        self._preview_after_id = None
         self.source_filter_var = tk.StringVar()
         self.target_filter_var = tk.StringVar()
         self.prefs = Config.load_preferences()
         self.gemini_client = GeminiClient()
+        self._target_ref_cache = {}
+        # Daemon workers, so a slow git call never holds up closing the app
+        self._executor = DaemonExecutor(max_workers=4, thread_name_prefix="pull_request")
+        self._preview_generation = 0
+        self._branch_tips = {}
+        self._git_batch = None
+        self._git_batch_lock = threading.Lock()
+        self._log_buffer = []
+        self._log_scheduled = False
+        self._log_lock = threading.Lock()
 
         # Create a container frame for the canvas and scrollbar
         self.container = ttk.Frame(self.parent)
@@ -76,8 +185,13 @@ class PullRequestApp:
              self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
     def _check_gh_cli(self):
-        # 0. Check for custom path in preferences
         custom_gh = self.prefs.get('gh_path', '').strip()
+        cached = PullRequestApp._gh_path_cache
+        if cached and cached[0] == custom_gh:
+            self.gh_path = cached[1]
+            return True
+
+        # 0. Check for custom path in preferences
         if custom_gh and os.path.exists(custom_gh):
             # If it's a file (e.g. /path/to/gh), get directory
             if os.path.isfile(custom_gh):
@@ -89,18 +203,21 @@ class PullRequestApp:
             os.environ["PATH"] = gh_dir + os.pathsep + os.environ["PATH"]
             print(f"DEBUG: Using custom gh path: {gh_dir}")
 
+        gh_path = shutil.which("gh")
+
         # On macOS, GUI apps often don't inherit the shell PATH, so we manually check common locations
-        if sys.platform == 'darwin' and not shutil.which("gh"):
+        if sys.platform == 'darwin' and not gh_path:
             common_paths = ["/opt/homebrew/bin", "/usr/local/bin"]
             for p in common_paths:
-                gh_path = os.path.join(p, "gh")
-                if os.path.exists(gh_path):
+                candidate = os.path.join(p, "gh")
+                if os.path.exists(candidate):
                     # Found it! Add to PATH for this process so subprocess can find it
                     os.environ["PATH"] += os.pathsep + p
-                    print(f"DEBUG: Found gh at {gh_path}, added to PATH")
+                    print(f"DEBUG: Found gh at {candidate}, added to PATH")
+                    gh_path = candidate
                     break
 
-        if not shutil.which("gh"):
+        if not gh_path:
             for widget in self.main_frame.winfo_children():
                 widget.destroy()
             
@@ -112,6 +229,9 @@ class PullRequestApp:
             error_label = ttk.Label(self.main_frame, text=error_msg, justify=tk.CENTER, font=("", 12))
             error_label.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
             return False
+
+        PullRequestApp._gh_path_cache = (custom_gh, gh_path)
+        self.gh_path = gh_path
         return True
 
     def build_ui(self):
@@ -136,7 +256,7 @@ class PullRequestApp:
         ttk.Label(branch_frame, text="Filter Source:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
         source_filter_entry = ttk.Entry(branch_frame, textvariable=self.source_filter_var)
         source_filter_entry.grid(row=1, column=1, sticky="ew", pady=2)
-        source_filter_entry.bind("<KeyRelease>", lambda e: self._filter_branches('source'))
+        source_filter_entry.bind("<KeyRelease>", lambda e: self._schedule_filter('source'))
         ttk.Label(branch_frame, text="Source Branch:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
         self.source_branch_combo = ttk.Combobox(branch_frame, state="readonly")
         self.source_branch_combo.grid(row=2, column=1, sticky="ew", pady=(2, 10))
@@ -146,7 +266,7 @@ class PullRequestApp:
         ttk.Label(branch_frame, text="Filter Target:").grid(row=3, column=0, sticky="w", padx=5, pady=2)
         target_filter_entry = ttk.Entry(branch_frame, textvariable=self.target_filter_var)
         target_filter_entry.grid(row=3, column=1, sticky="ew", pady=2)
-        target_filter_entry.bind("<KeyRelease>", lambda e: self._filter_branches('target'))
+        target_filter_entry.bind("<KeyRelease>", lambda e: self._schedule_filter('target'))
         ttk.Label(branch_frame, text="Target Branch:").grid(row=4, column=0, sticky="w", padx=5, pady=2)
         self.target_branch_combo = ttk.Combobox(branch_frame, state="readonly")
         self.target_branch_combo.grid(row=4, column=1, sticky="ew", pady=2)
@@ -216,22 +336,61 @@ class PullRequestApp:
         self.log_text.pack(fill=tk.X, pady=5)
 
     def log(self, message):
+        # Lines are buffered and written by the Tk thread at most every LOG_FLUSH_MS,
+        # since git commands run on worker threads and can log many lines at once
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if self._log_scheduled:
+                return
+            self._log_scheduled = True
+        self.parent.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        with self._log_lock:
+            lines = self._log_buffer
+            self._log_buffer = []
+            self._log_scheduled = False
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
-        self.parent.update_idletasks()
 
-    def _run_command(self, command_parts, check=True):
+    def _run_in_background(self, func, callback, *args):
+        """Runs func(*args) on the executor and calls callback(future) on the Tk thread."""
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.parent.after(0, callback, f))
+        return future
+
+    def _run_command(self, command_parts, check=True, log_output=True, stream=False):
+        """
+        Runs a command in the repository and returns its stripped stdout.
+        stream=True logs merged stdout/stderr line by line as it arrives and only keeps
+        the last STREAM_TAIL_CHARS characters for the return value (for push/gh).
+        """
         if not self.repo_path.get():
             raise ValueError("Repository path not set.")
         self.log(f"> {' '.join(command_parts)}")
         
-        # Hide console window on Windows
-        import sys
-        creation_flags = 0
-        if sys.platform == 'win32':
-            creation_flags = subprocess.CREATE_NO_WINDOW
+        if stream:
+            tail = ""
+            with subprocess.Popen(
+                command_parts,
+                cwd=self.repo_path.get(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+                creationflags=_CREATION_FLAGS
+            ) as process:
+                for line in process.stdout:
+                    self.log(line.rstrip())
+                    tail = (tail + line)[-STREAM_TAIL_CHARS:]
+                returncode = process.wait()
+            if check and returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command_parts, output=tail)
+            return tail.strip()
         
         process = subprocess.run(
             command_parts, 
@@ -240,9 +399,9 @@ class PullRequestApp:
             text=True, 
             encoding='utf-8', 
             errors='ignore',
-            creationflags=creation_flags
+            creationflags=_CREATION_FLAGS
         )
-        if process.stdout:
+        if process.stdout and log_output:
             self.log(process.stdout.strip())
         if process.stderr:
             self.log(f"ERROR: {process.stderr.strip()}")
@@ -250,6 +409,30 @@ class PullRequestApp:
             process.check_returncode()
         return process.stdout.strip()
 
+    def _ref_exists(self, ref):
+        """Checks a full ref name with show-ref (exit code only, nothing logged)."""
+        result = subprocess.run(
+            ["git", "show-ref", "--verify", "--quiet", ref],
+            cwd=self.repo_path.get(),
+            creationflags=_CREATION_FLAGS
+        )
+        return result.returncode == 0
+
+    def _resolve_ref(self, branch, prefer_remote):
+        """
+        Returns the ref to compare with for a branch name, cached per branch.
+        Targets prefer origin/<branch>; sources prefer the local branch.
+        """
+        key = (branch, prefer_remote)
+        if key not in self._target_ref_cache:
+            has_remote = self._ref_exists(f"refs/remotes/origin/{branch}")
+            has_local = self._ref_exists(f"refs/heads/{branch}")
+            if has_remote and (prefer_remote or not has_local):
+                self._target_ref_cache[key] = f"origin/{branch}"
+            else:
+                self._target_ref_cache[key] = branch
+        return self._target_ref_cache[key]
+
     def browse_repository(self):
         path = filedialog.askdirectory(title="Select a Git repository folder")
         if path and os.path.isdir(os.path.join(path, '.git')):
@@ -260,6 +443,26 @@ class PullRequestApp:
         elif path:
             messagebox.showerror("Error", "The selected folder is not a valid Git repository.")
 
+    def _schedule_filter(self, combo_type):
+        """Filters once typing pauses instead of on every keystroke."""
+        if self._filter_after_id[combo_type]:
+            self.parent.after_cancel(self._filter_after_id[combo_type])
+        self._filter_after_id[combo_type] = self.parent.after(DEBOUNCE_MS, self._run_scheduled_filter, combo_type)
+
+    def _run_scheduled_filter(self, combo_type):
+        self._filter_after_id[combo_type] = None
+        self._filter_branches(combo_type)
+
+    def _schedule_preview(self):
+        """Refreshes the preview once selection changes settle."""
+        if self._preview_after_id:
+            self.parent.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.parent.after(DEBOUNCE_MS, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        self._preview_after_id = None
+        self._update_preview()
+
     def _filter_branches(self, combo_type):
         """Filters the branch list for the specified combobox."""
         if combo_type == 'source':
@@ -271,7 +474,14 @@ class PullRequestApp:
             combo = self.target_branch_combo
             current_val = combo.get()
 
-        filtered_list = [b for b in self.all_branches if filter_term in b.lower()]
+        # Typing more characters can only narrow the matches, so search the previous result
+        previous_term, candidates = self._last_filter.get(combo_type, ("", range(len(self.all_branches))))
+        if previous_term not in filter_term:
+            candidates = range(len(self.all_branches))
+        matches = [i for i in candidates if filter_term in self._all_branches_lower[i]]
+        self._last_filter[combo_type] = (filter_term, matches)
+
+        filtered_list = [self.all_branches[i] for i in matches]
         combo['values'] = filtered_list
 
         if current_val in filtered_list:
@@ -282,44 +492,46 @@ class PullRequestApp:
             combo.set('')
 
     def _load_branches(self):
+        self.log("\n--- Loading branches ---")
+        self._run_in_background(self._load_branches_worker, self._on_branches_loaded)
+
+    def _load_branches_worker(self):
+        """Reads local and remote branch names (worker thread)."""
+        repo_path = self.repo_path.get()
+        if not repo_path:
+            raise ValueError("Repository path not set.")
+        # Always read the live refs: a branch list cached on disk goes stale with every fetch
+        branches, current_branch, tips = _list_refs(repo_path)
+        self._branch_tips = dict(tips)
+        return list(branches), current_branch
+
+    def _on_branches_loaded(self, future):
         try:
-            self.log("\n--- Loading branches ---")
-            branch_output = self._run_command(["git", "branch", "-a"])
-            branches = []
-            current_branch = ""
-            
-            for line in branch_output.splitlines():
-                clean_branch = line.strip().replace("* ", "")
-                if "->" in clean_branch:
-                    continue  # Skip symbolic refs
-                if line.startswith("*"):
-                    current_branch = clean_branch
-                if clean_branch.startswith("remotes/origin/"):
-                    clean_branch = clean_branch.replace("remotes/origin/", "")
-                if clean_branch not in branches:
-                    branches.append(clean_branch)
-            
-            self.all_branches = sorted(branches)
-            
-            # Reset filters and populate comboboxes
-            self.source_filter_var.set("")
-            self.target_filter_var.set("")
-            self._filter_branches('source')
-            self._filter_branches('target')
-            
-            if current_branch in self.source_branch_combo['values']:
-                self.source_branch_combo.set(current_branch)
-            
-            # Set default target
-            default_target = self.prefs.get('pr_creator', {}).get('default_target', 'main')
-            for default in [default_target, "main", "master", "develop"]:
-                if default in self.target_branch_combo['values']:
-                    self.target_branch_combo.set(default)
-                    break
-            
-            self._on_source_branch_selected()
+            self.all_branches, current_branch = future.result()
         except (subprocess.CalledProcessError, ValueError) as e:
             messagebox.showerror("Git Error", f"Failed to load branch data:\n{e}")
+            return
+        self._all_branches_lower = [b.lower() for b in self.all_branches]
+        self._last_filter.clear()
+        self._target_ref_cache.clear()
+        
+        # Reset filters and populate comboboxes
+        self.source_filter_var.set("")
+        self.target_filter_var.set("")
+        self._filter_branches('source')
+        self._filter_branches('target')
+        
+        if current_branch in self.source_branch_combo['values']:
+            self.source_branch_combo.set(current_branch)
+        
+        # Set default target
+        default_target = self.prefs.get('pr_creator', {}).get('default_target', 'main')
+        for default in [default_target, "main", "master", "develop"]:
+            if default in self.target_branch_combo['values']:
+                self.target_branch_combo.set(default)
+                break
+        
+        self._on_source_branch_selected()
 
     def _update_preview(self):
         """Updates the files and commits preview tabs."""
@@ -333,54 +545,57 @@ class PullRequestApp:
         self.files_tree.delete(*self.files_tree.get_children())
         self.commits_tree.delete(*self.commits_tree.get_children())
         
+        # Results from an earlier selection that finish late are dropped
+        self._preview_generation += 1
+        generation = self._preview_generation
+        self._run_in_background(
+            self._preview_worker,
+            lambda f: self._on_preview_loaded(f, generation),
+            source, target
+        )
+
+    def _preview_worker(self, source, target):
+        """Collects commits and per-file line counts for the preview (worker thread)."""
+        target_ref = self._resolve_ref(target, prefer_remote=True)
+        source_ref = self._resolve_ref(source, prefer_remote=False)
+        # -z separates every field and numstat entry with NUL, so '|' in names or subjects is harmless
+        log_format = f"--pretty=format:{COMMIT_MARKER}%h%x00%an%x00%ai%x00%s"
+        log_output = self._run_command(
+            ["git", "log", "-z", log_format, f"{target_ref}..{source_ref}"],
+            check=False, log_output=False
+        )
+        # The net change since the merge base, as the PR will show it (not per-commit churn)
+        diff_output = self._run_command(
+            ["git", "diff", "-z", "--numstat", f"{target_ref}...{source_ref}"],
+            check=False, log_output=False
+        )
+        return _parse_preview_log(log_output), _parse_numstat(diff_output)
+
+    def _on_preview_loaded(self, future, generation):
+        if generation != self._preview_generation:
+            return
         try:
-            # 1. Get Files Changed (git diff --stat)
-            # Use origin/ prefix if available, else local
-            base_ref = f"origin/{target}" if f"origin/{target}" in self.all_branches or True else target # Simplified logic, usually origin exists
-            head_ref = source # Local source
-            
-            # Check if origin/target exists, if not try local target
-            # Actually, let's just try generic logic:
-            # If we are pushing source to origin, we compare source against origin/target usually.
-            
-            # Let's try to find the merge base or just use dot-dot-dot
-            # git diff --stat origin/target...source
-            
-            diff_cmd = ["git", "diff", "--stat", f"origin/{target}...{source}"]
-            stat_output = self._run_command(diff_cmd, check=False)
-            
-            if not stat_output.strip():
-                 # Try local target
-                 diff_cmd = ["git", "diff", "--stat", f"{target}...{source}"]
-                 stat_output = self._run_command(diff_cmd, check=False)
-
-            for line in stat_output.splitlines():
-                if "|" in line:
-                    parts = line.split("|")
-                    if len(parts) == 2:
-                        fpath = parts[0].strip()
-                        stats = parts[1].strip()
-                        self.files_tree.insert("", "end", values=(fpath, stats))
-
-            # 2. Get Commits (git log)
-            log_cmd = ["git", "log", "--pretty=format:%h|%an|%ai|%s", f"origin/{target}..{source}"]
-            log_output = self._run_command(log_cmd, check=False)
-            
-            if not log_output.strip():
-                log_cmd = ["git", "log", "--pretty=format:%h|%an|%ai|%s", f"{target}..{source}"]
-                log_output = self._run_command(log_cmd, check=False)
-
-            for line in log_output.splitlines():
-                parts = line.split("|")
-                if len(parts) >= 4:
-                    h = parts[0]
-                    auth = parts[1]
-                    date = parts[2]
-                    subj = "|".join(parts[3:])
-                    self.commits_tree.insert("", "end", values=(h, auth, date, subj))
-                    
+            commits, files = future.result()
         except Exception as e:
             self.log(f"Error updating preview: {e}")
+            return
+
+        file_rows = [
+            (fpath, "binary" if counts is None else f"+{counts[0]} -{counts[1]}")
+            for fpath, counts in files.items()
+        ]
+        self._fill_tree(self.files_tree, file_rows)
+        self._fill_tree(self.commits_tree, commits)
+
+    def _fill_tree(self, tree, rows):
+        """
+        Replaces all rows of a preview tree in one pass.
+        Runs inside a single Tk callback, so the tree is redrawn once after all inserts.
+        """
+        tree.delete(*tree.get_children())
+        insert = tree.insert
+        for values in rows:
+            insert("", "end", values=values)
 
     def _open_github_link(self):
         """Opens the PR link in browser."""
@@ -413,30 +628,58 @@ class PullRequestApp:
         # Disable button and show loading state
         original_text = self.ai_button.config('text')[-1]
         self.ai_button.config(text="⏳ Generating...", state=tk.DISABLED)
-        self.parent.update_idletasks()
         
+        self.log(f"\n--- Generating PR content with AI ---")
+        self.log(f"Analyzing diff between '{target}' and '{source}'...")
+        self._run_in_background(
+            self._generate_with_ai_worker,
+            lambda f: self._on_ai_content_generated(f, original_text),
+            source, target
+        )
+
+    def _generate_with_ai_worker(self, source, target):
+        """Fetches the branch diff and asks Gemini for PR content (worker thread)."""
+        # Get the diff between target and source
+        target_ref = self._resolve_ref(target, prefer_remote=True)
+        source_ref = self._resolve_ref(source, prefer_remote=False)
+        diff_output = self._read_diff_bounded(f"{target_ref}...{source_ref}")
+        
+        self.log(f"Diff size: {len(diff_output)} characters")
+        
+        # Call Gemini API
+        self.log("Calling Gemini API...")
+        return self.gemini_client.generate_pr_content(diff_output, source, target)
+
+    def _read_diff_bounded(self, ref_range):
+        """
+        Returns `git diff --stat` followed by at most MAX_DIFF_BYTES of the patch.
+        The patch is read straight from the pipe so large diffs are never fully buffered.
+        """
+        stat_output = self._run_command(["git", "diff", "--stat", ref_range], check=False)
+        
+        with subprocess.Popen(
+            ["git", "diff", "-U3", "--diff-filter=AM", ref_range],
+            cwd=self.repo_path.get(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=_CREATION_FLAGS
+        ) as process:
+            patch = process.stdout.read(MAX_DIFF_BYTES)
+            truncated = bool(process.stdout.read(1))
+            if truncated:
+                process.terminate()
+        
+        diff_text = patch.decode('utf-8', errors='ignore')
+        if truncated:
+            diff_text += "\n... (diff truncated)"
+        if not diff_text.strip():
+            # Only deletions or renames: the stat alone describes the change
+            return stat_output
+        return f"{stat_output}\n\n{diff_text}"
+
+    def _on_ai_content_generated(self, future, original_text):
         try:
-            self.log(f"\n--- Generating PR content with AI ---")
-            self.log(f"Analyzing diff between '{target}' and '{source}'...")
-            
-            # Get the diff between target and source
-            diff_output = self._run_command([
-                "git", "diff", 
-                f"origin/{target}...{source}"
-            ], check=False)
-            
-            if not diff_output.strip():
-                # Try without origin/ prefix
-                diff_output = self._run_command([
-                    "git", "diff", 
-                    f"{target}...{source}"
-                ], check=False)
-            
-            self.log(f"Diff size: {len(diff_output)} characters")
-            
-            # Call Gemini API
-            self.log("Calling Gemini API...")
-            result = self.gemini_client.generate_pr_content(diff_output, source, target)
+            result = future.result()
             
             if result:
                 # Populate fields
@@ -466,23 +709,62 @@ class PullRequestApp:
         branch = self.source_branch_combo.get()
         if not branch:
             return
+        self.log(f"\nFetching last commit info for '{branch}'...")
+        self._run_in_background(
+            self._last_commit_worker,
+            lambda f: self._on_last_commit_loaded(f, branch),
+            branch
+        )
+        
+        self._schedule_preview()
+
+    def _last_commit_worker(self, branch):
+        """Reads the subject and body of the branch tip (worker thread)."""
+        repo_path = self.repo_path.get()
+        # The tip SHA also covers branches that only exist on origin
+        tip = self._branch_tips.get(branch)
         try:
-            self.log(f"\nFetching last commit info for '{branch}'...")
-            title = self._run_command(["git", "log", branch, "-1", "--pretty=%s"])
-            body = self._run_command(["git", "log", branch, "-1", "--pretty=%b"])
-            self.title_entry.delete(0, tk.END)
-            self.title_entry.insert(0, title)
-            self.description_text.config(state=tk.NORMAL)
-            self.description_text.delete("1.0", tk.END)
-            self.description_text.insert("1.0", body)
-            self.log("Auto-filled title and description.")
+            title, body = self._get_git_batch(repo_path).get_commit(tip or branch)
+        except (OSError, ValueError):
+            output = self._run_command(["git", "log", branch, "-1", "--pretty=format:%s%x00%b"], log_output=False)
+            title, _, body = output.partition("\0")
+            body = body.strip()
+        return title, body
+
+    def _get_git_batch(self, repo_path):
+        """
+        Returns the persistent cat-file reader for repo_path, replacing it if the repo changed.
+        Called from executor workers, so creating and replacing the reader is serialized.
+        """
+        with self._git_batch_lock:
+            if self._git_batch is None or self._git_batch.repo_path != repo_path:
+                if self._git_batch is not None:
+                    # Waits for a lookup still running on the old reader (GitBatch holds its own lock)
+                    self._git_batch.close()
+                self._git_batch = GitBatch(repo_path)
+            return self._git_batch
+
+    def __del__(self):
+        if self._git_batch is not None:
+            self._git_batch.close()
+
+    def _on_last_commit_loaded(self, future, branch):
+        try:
+            title, body = future.result()
         except (subprocess.CalledProcessError, ValueError) as e:
             self.log(f"Could not fetch commit info for '{branch}': {e}")
-        
-        self._update_preview()
+            return
+        self.title_entry.delete(0, tk.END)
+        self.title_entry.insert(0, title)
+        self.description_text.config(state=tk.NORMAL)
+        self.description_text.delete("1.0", tk.END)
+        self.description_text.insert("1.0", body)
+        self.log("Auto-filled title and description.")
     
     def _on_target_branch_selected(self, event=None):
-        self._update_preview()
+        # Remote refs may have changed since the last selection (e.g. after a fetch)
+        self._target_ref_cache.clear()
+        self._schedule_preview()
     
     def create_pull_request(self):
         source = self.source_branch_combo.get()
@@ -498,11 +780,30 @@ class PullRequestApp:
             return self.log("PR creation cancelled.")
         
         self.log("\n--- Creating Pull Request ---")
-        try:
+        self.create_pr_button.config(state=tk.DISABLED)
+        self._run_in_background(self._create_pull_request_worker, self._on_pull_request_created, source, target, title, body)
+
+    def _create_pull_request_worker(self, source, target, title, body):
+        """Pushes the source branch and opens the PR with gh (worker thread)."""
+        if self._is_pushed(source):
+            self.log(f"'{source}' is already up-to-date on origin, skipping push.")
+        else:
             self.log(f"Pushing '{source}' to origin...")
-            self._run_command(["git", "push", "-u", "origin", source])
-            command = ["gh", "pr", "create", "--base", target, "--head", source, "--title", title, "--body", body]
-            result = self._run_command(command)
+            self._run_command(["git", "push", "-u", "origin", source], stream=True)
+        command = [getattr(self, "gh_path", None) or "gh", "pr", "create", "--base", target, "--head", source, "--title", title, "--body", body]
+        return self._run_command(command, stream=True)
+
+    def _is_pushed(self, branch):
+        """True if origin/<branch> already points at the local branch tip."""
+        if not self._ref_exists(f"refs/remotes/origin/{branch}"):
+            return False
+        tips = self._run_command(["git", "rev-parse", branch, f"origin/{branch}"], check=False).splitlines()
+        return len(tips) == 2 and tips[0] == tips[1]
+
+    def _on_pull_request_created(self, future):
+        self.create_pr_button.config(state=tk.NORMAL)
+        try:
+            result = future.result()
             self.log("✅ Pull Request created successfully!")
             
             # Extract URL
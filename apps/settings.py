@@ -5,25 +5,223 @@ Allows configuration of API keys and checking for updates.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import requests
+import atexit
+import hashlib
+import json
+import os
+import queue
 import threading
-import webbrowser
-import shutil
+from collections import deque
 import tempfile
+import time
+import subprocess
 import sys
 from pathlib import Path
 
 from config import Config
 from utils.versioning import is_newer_version
 from utils.ui_utils import CenteredDialog
+from utils.thread_utils import DaemonExecutor
+
+# Keep the updater from flashing a console window on Windows
+_POPEN_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+# Reused worker threads for update checks, downloads and preference writes
+# Daemon workers, so closing the app never waits for a stalled download
+_EXECUTOR = DaemonExecutor(max_workers=2, thread_name_prefix='settings-net')
+
+_download_session = None
+
+# Last update-check response, reused for UPDATE_CACHE_TTL seconds (by default) and revalidated by ETag after that
+UPDATE_CACHE_TTL = 15 * 60
+_update_cache = {'ts': 0, 'etag': None, 'last_modified': None, 'data': None}
+_update_fetch_lock = threading.Lock()
+# Kept out of preferences.json, which the tab apps and the Settings dialog rewrite on their own
+UPDATE_CACHE_FILE = Config._CONFIG_DIR / 'cache' / 'update_check.json'
+
+
+# Large update archives are fetched as parallel byte ranges over the shared session
+RANGE_SLICE_SIZE = 8 * 1024 * 1024
+RANGE_WORKERS = 4
+# A separate pool: the caller already runs on _EXECUTOR
+_RANGE_POOL = DaemonExecutor(max_workers=RANGE_WORKERS, thread_name_prefix='settings-range')
+_write_lock = threading.Lock()
+
+
+class _RangesUnsupported(Exception):
+    """The server answered a Range request with the whole file."""
+
+
+def _write_at(fd, data, offset):
+    """Write all of data at offset without disturbing other writers."""
+    view = memoryview(data)
+    if hasattr(os, 'pwrite'):
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    else:
+        # Windows has no pwrite; serialize seek+write instead
+        with _write_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while view:
+                view = view[os.write(fd, view):]
+
+
+def _download_range(download_url, fd, start, end, on_bytes, completed):
+    import requests
+    
+    # identity encoding so byte offsets map directly onto the file
+    headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+    with _get_download_session().get(download_url, headers=headers, stream=True, timeout=(5, 10)) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise _RangesUnsupported(download_url)
+        offset = start
+        for chunk in response.iter_content(256 * 1024):
+            _write_at(fd, chunk, offset)
+            offset += len(chunk)
+            on_bytes(len(chunk))
+    if offset != end + 1:
+        raise requests.exceptions.ChunkedEncodingError(f"Range {start}-{end} ended early at byte {offset}")
+    completed.add(start)
+
+
+def _download_ranges(download_url, fd, total_size, on_bytes, completed):
+    """
+    Fetch total_size bytes as RANGE_SLICE_SIZE slices on RANGE_WORKERS connections.
+    Slices whose start offset is in completed are skipped; finished ones are added to it.
+    """
+    slices = [(start, min(start + RANGE_SLICE_SIZE, total_size) - 1)
+              for start in range(0, total_size, RANGE_SLICE_SIZE) if start not in completed]
+    futures = [_RANGE_POOL.submit(_download_range, download_url, fd, start, end, on_bytes, completed)
+               for start, end in slices]
+    try:
+        for future in futures:
+            future.result()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        # Slices already running still write into fd; wait for them before the caller closes it
+        for future in futures:
+            if not future.cancelled():
+                try:
+                    future.result()
+                except BaseException:
+                    pass
+        raise
+
+
+def _get_download_session():
+    """
+    Shared session for update downloads, created on first use.
+    Keeps the TLS connection to GitHub pooled across calls and retries.
+    requests is imported lazily; version checks use urllib (see fetch_update_info).
+    """
+    global _download_session
+    if _download_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        _download_session = requests.Session()
+        _download_session.headers.update({'User-Agent': 'GitToolSuite-Updater', 'Accept-Encoding': 'gzip, deflate'})
+        _download_session.mount('https://', HTTPAdapter(
+            pool_maxsize=8,
+            # Connection and 429/5xx failures are retried inside urllib3, honouring Retry-After;
+            # the download loop only handles bodies that break off mid-stream
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                              allowed_methods=['GET', 'HEAD'], respect_retry_after_header=True)
+        ))
+        atexit.register(_download_session.close)
+    return _download_session
+
+def _load_update_cache():
+    try:
+        with open(UPDATE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        return stored if isinstance(stored, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading update check cache: {e}")
+        return {}
+
+
+def _save_update_cache():
+    try:
+        UPDATE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = UPDATE_CACHE_FILE.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({key: _update_cache[key] for key in ('ts', 'etag', 'last_modified', 'data')}, f)
+        os.replace(tmp_file, UPDATE_CACHE_FILE)
+    except Exception as e:
+        print(f"Error saving update check cache: {e}")
+
+
+def fetch_update_info(max_age=UPDATE_CACHE_TTL):
+    """
+    Return the update JSON, reused while younger than max_age seconds, otherwise revalidated with a conditional GET.
+    The validators, last response and its time are kept in UPDATE_CACHE_FILE, so a relaunch can skip the request
+    or get a 304. Concurrent callers share one request.
+    Shared by the Settings check and the launch-time check in main.py.
+    """
+    with _update_fetch_lock:
+        if _update_cache['data'] is None:
+            stored = _load_update_cache()
+            if stored.get('data') is not None:
+                _update_cache.update({
+                    'ts': stored.get('ts', 0),
+                    'etag': stored.get('etag'),
+                    'last_modified': stored.get('last_modified'),
+                    'data': stored['data'],
+                })
+        if _update_cache['data'] is not None and time.time() - _update_cache['ts'] < max_age:
+            return _update_cache['data']
+        
+        # Only needed once an update check actually goes to the network
+        try:
+            import orjson as json_lib  # Optional, faster decoding
+        except ImportError:
+            import json as json_lib
+        import urllib.error
+        import urllib.request
+        
+        headers = {'User-Agent': f'GitToolSuite/{Config.APP_VERSION}'}
+        if _update_cache['data'] is not None:
+            if _update_cache['etag']:
+                headers['If-None-Match'] = _update_cache['etag']
+            if _update_cache['last_modified']:
+                headers['If-Modified-Since'] = _update_cache['last_modified']
+        request = urllib.request.Request(Config.UPDATE_CHECK_URL, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                data = json_lib.loads(response.read())
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            _update_cache.update({'etag': etag, 'last_modified': last_modified, 'data': data})
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            # Not modified: keep the cached data, just restart the TTL
+        
+        _update_cache['ts'] = time.time()
+        _save_update_cache()
+        return _update_cache['data']
+
 
 class SettingsApp(CenteredDialog):
     def __init__(self, parent):
         super().__init__(parent, "Settings", width=650, height=800)
+        # Keep the window unmapped while it is populated so it is laid out and drawn once
+        self.withdraw()
         self.prefs = Config.load_preferences()
         self.api_key_var = tk.StringVar(value=self.prefs.get('api_key', ''))
         self.product_key_var = tk.StringVar(value=self.prefs.get('product_key', ''))
         self.gh_path_var = tk.StringVar(value=self.prefs.get('gh_path', ''))
+        self._save_after_id = None
+        self.style = ttk.Style()
+        self._configure_styles()
         
         # Add a scrollable container for the settings if they exceed window height
         self.container = ttk.Frame(self)
@@ -53,13 +251,15 @@ class SettingsApp(CenteredDialog):
         btn_frame = ttk.Frame(self, padding=10)
         btn_frame.pack(fill=tk.X, side=tk.BOTTOM)
         ttk.Button(btn_frame, text="Close", command=self.destroy, style="Accent.TButton").pack(side=tk.RIGHT, padx=20, pady=10)
+        self.deiconify()
         
     def build_ui(self):
         # Title
-        ttk.Label(self.main_frame, text="Settings", font=("", 16, "bold")).pack(anchor=tk.W, pady=(0, 20))
+        ttk.Label(self.main_frame, text="Settings", style='SettingsTitle.TLabel').pack(anchor=tk.W, pady=(0, 20))
         
         # 0. Product Activation (Limited Edition)
-        is_limited = Config.is_limited_edition()
+        # Decided once from the dialog's prefs instead of re-reading the file
+        is_limited = Config.validate_product_key(self.prefs.get('product_key', ''))
         
         prod_frame = ttk.LabelFrame(self.main_frame, text="Product Activation", padding="15")
         prod_frame.pack(fill=tk.X, pady=(0, 20))
@@ -68,7 +268,7 @@ class SettingsApp(CenteredDialog):
             # Active State
             success_frame = ttk.Frame(prod_frame)
             success_frame.pack(fill=tk.X)
-            ttk.Label(success_frame, text="✅ Limited Edition Active", font=("", 12, "bold"), foreground="green").pack(side=tk.LEFT)
+            ttk.Label(success_frame, text="✅ Limited Edition Active", style='SettingsSuccess.TLabel').pack(side=tk.LEFT)
             # ttk.Button(success_frame, text="Deactivate", command=self.deactivate_product).pack(side=tk.RIGHT)
         else:
             # Inactive State
@@ -97,7 +297,7 @@ class SettingsApp(CenteredDialog):
             ttk.Button(entry_frame, text="Save", command=self.save_api_key).pack(side=tk.LEFT, padx=5)
             ttk.Button(entry_frame, text="Clear", command=self.clear_api_key).pack(side=tk.LEFT)
             
-            ttk.Label(api_frame, text="Note: Provide your own Gemini API key, or use a Product Key.", font=("", 8, "italic")).pack(anchor=tk.W, pady=(5, 0))
+            ttk.Label(api_frame, text="Note: Provide your own Gemini API key, or use a Product Key.", style='SettingsNote.TLabel').pack(anchor=tk.W, pady=(5, 0))
         
         # 2. GitHub CLI Configuration
         gh_frame = ttk.LabelFrame(self.main_frame, text="GitHub CLI Configuration", padding="15")
@@ -112,7 +312,7 @@ class SettingsApp(CenteredDialog):
         ttk.Button(gh_entry_frame, text="Browse...", command=self.browse_gh_path).pack(side=tk.LEFT, padx=5)
         ttk.Button(gh_entry_frame, text="Save Path", command=self.save_gh_path).pack(side=tk.LEFT)
         
-        ttk.Label(gh_frame, text="Leave empty to use system PATH.", font=("", 8, "italic")).pack(anchor=tk.W, pady=(5, 0))
+        ttk.Label(gh_frame, text="Leave empty to use system PATH.", style='SettingsNote.TLabel').pack(anchor=tk.W, pady=(5, 0))
 
         # 3. UI Theme
         theme_frame = ttk.LabelFrame(self.main_frame, text="UI Theme", padding="15")
@@ -128,7 +328,7 @@ class SettingsApp(CenteredDialog):
         version_frame = ttk.Frame(update_frame)
         version_frame.pack(fill=tk.X)
         
-        ttk.Label(version_frame, text=f"Current Version: {Config.APP_VERSION}", font=("", 10)).pack(side=tk.LEFT)
+        ttk.Label(version_frame, text=f"Current Version: {Config.APP_VERSION}", style='SettingsVersion.TLabel').pack(side=tk.LEFT)
         
         self.check_btn = ttk.Button(version_frame, text="Check for Updates", command=self.check_for_updates)
         self.check_btn.pack(side=tk.RIGHT)
@@ -139,13 +339,20 @@ class SettingsApp(CenteredDialog):
         
         ttk.Label(about_frame, text="Git Productivity Tools Suite").pack(anchor=tk.W)
 
+    def _configure_styles(self):
+        """Named label styles, so fonts are resolved once instead of per widget."""
+        self.style.configure('SettingsTitle.TLabel', font=("", 16, "bold"))
+        self.style.configure('SettingsSuccess.TLabel', font=("", 12, "bold"), foreground="green")
+        self.style.configure('SettingsNote.TLabel', font=("", 8, "italic"))
+        self.style.configure('SettingsVersion.TLabel', font=("", 10))
+
     def save_api_key(self):
         key = self.api_key_var.get().strip()
         if not key:
             return messagebox.showwarning("Warning", "API Key cannot be empty.")
             
         self.prefs['api_key'] = key
-        Config.save_preferences(self.prefs)
+        self._schedule_save()
         messagebox.showinfo("Success", "API Key saved successfully.\nPlease restart the application for changes to take effect.")
 
     def clear_api_key(self):
@@ -153,9 +360,20 @@ class SettingsApp(CenteredDialog):
             self.api_key_var.set("")
             if 'api_key' in self.prefs:
                 del self.prefs['api_key']
-                Config.save_preferences(self.prefs)
+                self._schedule_save()
             messagebox.showinfo("Success", "API Key cleared.")
 
+    def _schedule_save(self):
+        """Coalesce quick successive edits into one preferences write."""
+        if self._save_after_id:
+            self.parent.after_cancel(self._save_after_id)
+        self._save_after_id = self.parent.after(300, self._flush_prefs)
+
+    def _flush_prefs(self):
+        self._save_after_id = None
+        prefs = dict(self.prefs)
+        _EXECUTOR.submit(Config.save_preferences, prefs)
+
     def browse_gh_path(self):
         from tkinter import filedialog
         path = filedialog.askopenfilename(title="Select gh executable")
@@ -166,7 +384,7 @@ class SettingsApp(CenteredDialog):
         path = self.gh_path_var.get().strip()
         # Allow saving empty path to clear it
         self.prefs['gh_path'] = path
-        Config.save_preferences(self.prefs)
+        self._schedule_save()
         messagebox.showinfo("Success", "GitHub CLI path saved.\nPlease restart the application.")
     
     def activate_product(self):
@@ -217,38 +435,37 @@ class SettingsApp(CenteredDialog):
 
     def check_for_updates(self):
         self.check_btn.config(state=tk.DISABLED, text="Checking...")
-        threading.Thread(target=self._update_worker, daemon=True).start()
+        _EXECUTOR.submit(self._update_worker)
 
 
     def _update_worker(self):
         try:
-            response = requests.get(Config.UPDATE_CHECK_URL, timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            data = fetch_update_info()
             
             latest_version = data.get('version')
             release_url = data.get('release_url', "https://github.com/tan-mike/git-tool-suite/releases")
             download_url = data.get('download_url')
+            expected_sha256 = data.get('sha256')
             
             # Platform-specific download URL
             if sys.platform == 'darwin' and data.get('download_mac_url'):
                 download_url = data.get('download_mac_url')
+                expected_sha256 = data.get('sha256_mac')
             # Windows/Default falls back to download_url which is already set above
             
-            self.parent.after(0, lambda: self._show_update_result(latest_version, release_url, download_url))
+            self.parent.after(0, lambda: self._show_update_result(latest_version, release_url, download_url, expected_sha256))
         except Exception as e:
             error_msg = f"Failed to check for updates:\n{e}"
             self.parent.after(0, lambda: messagebox.showerror("Error", error_msg))
         finally:
             self.parent.after(0, lambda: self.check_btn.config(state=tk.NORMAL, text="Check for Updates"))
 
-    def _show_update_result(self, latest_version, release_url, download_url):
+    def _show_update_result(self, latest_version, release_url, download_url, expected_sha256=None):
+        import webbrowser
         current = Config.APP_VERSION
-        # Simple string comparison (works for simple versions like "3.1" vs "3.2")
-        # For more complex semver, we might need packaging.version
+        # Numeric comparison, so "3.10" is newer than "3.9"
         if is_newer_version(latest_version, current):
             # Check if running as executable
-            import sys
             is_executable = getattr(sys, 'frozen', False)
             
             if is_executable and download_url:
@@ -263,7 +480,7 @@ class SettingsApp(CenteredDialog):
                 )
                 
                 if response is True:  # Yes - Auto update
-                    self._download_and_install_update(download_url)
+                    self._download_and_install_update(download_url, expected_sha256)
                 elif response is False:  # No - Manual download
                     webbrowser.open(release_url)
             else:
@@ -277,6 +494,8 @@ class SettingsApp(CenteredDialog):
         try:
             import sv_ttk
             sv_ttk.toggle_theme()
+            # Style options are per theme, so re-apply them to the new one
+            self._configure_styles()
             
             # Save preference
             current_theme = sv_ttk.get_theme()
@@ -287,14 +506,13 @@ class SettingsApp(CenteredDialog):
         except Exception as e:
             messagebox.showerror("Theme Error", f"Failed to toggle theme: {e}")
     
-    def _download_and_install_update(self, download_url):
-        """Download and install the update automatically with progress tracking."""
-        import sys
-        # from pathlib import Path # Already imported
-        import tempfile
-        import subprocess
-        import time
-        import os
+    def _download_and_install_update(self, download_url, expected_sha256=None):
+        """
+        Download and install the update automatically with progress tracking.
+        If the manifest provides a SHA-256, it is computed while writing and checked before installing.
+        """
+        import requests
+        from urllib3.exceptions import HTTPError as RawStreamError
         
         try:
             # Show progress window
@@ -316,92 +534,216 @@ class SettingsApp(CenteredDialog):
             speed_label = ttk.Label(progress_window, text="", font=("", 8))
             speed_label.pack(pady=(5, 15))
             
+            # Single-slot queue: the download thread overwrites it, the Tk poller drains it
+            ui_state = queue.Queue(maxsize=1)
+            
+            def publish_progress(state):
+                try:
+                    ui_state.put_nowait(state)
+                except queue.Full:
+                    try:
+                        ui_state.get_nowait()
+                    except queue.Empty:
+                        pass
+                    ui_state.put_nowait(state)
+            
+            def drain_progress():
+                if not progress_window.winfo_exists():
+                    return  # Window closed; stop polling
+                try:
+                    downloaded, total_size, elapsed = ui_state.get_nowait()
+                except queue.Empty:
+                    pass
+                else:
+                    # Each quantity is computed once per redraw
+                    downloaded_mb = downloaded / (1 << 20)
+                    speed = downloaded_mb / elapsed  # MB/s
+                    if total_size > 0:
+                        total_mb = total_size / (1 << 20)
+                        percent = downloaded / total_size * 100
+                        remaining = (total_mb - downloaded_mb) / speed if speed > 0 else 0
+                        
+                        progress_bar.config(value=downloaded)
+                        status_label.config(text=f"Downloaded {downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percent:.0f}%)")
+                        speed_label.config(text=f"{speed:.1f} MB/s - ~{remaining:.0f}s remaining")
+                    else:
+                        status_label.config(text=f"Downloaded {downloaded_mb:.1f} MB")
+                        speed_label.config(text=f"{speed:.1f} MB/s")
+                self.parent.after(150, drain_progress)
+            
+            def show_status(status, speed, **bar_options):
+                """Apply one status transition from the download thread in a single Tk callback."""
+                def apply():
+                    if bar_options:
+                        progress_bar.config(**bar_options)
+                        if bar_options.get('mode') == 'indeterminate':
+                            progress_bar.start()
+                    status_label.config(text=status)
+                    speed_label.config(text=speed)
+                self.parent.after(0, apply)
+            
+            def show_error(title, message):
+                """Close the progress window and report the failure in a single Tk callback."""
+                def apply():
+                    progress_window.destroy()
+                    messagebox.showerror(title, message)
+                self.parent.after(0, apply)
+            
+            self.parent.after(150, drain_progress)
+            
             # Download in thread with retry logic
             def download():
                 max_retries = 3
-                chunk_size = 32 * 1024 * 1024  # 32 MB chunks for maximum speed
-                update_interval = 5 * 1024 * 1024  # Update UI every 5 MB downloaded
+                base_chunk_size = 256 * 1024  # Small reads keep progress steady and limit lost work on a drop
+                max_chunk_size = 1024 * 1024  # Used once throughput is high enough to make syscalls matter
+                fast_throughput = 20 * 1024 * 1024  # bytes/s
+                
+                # Kept across attempts so a retry continues from what is already on disk
+                temp_zip = Path(tempfile.gettempdir()) / "GitToolSuite_update.zip"
+                downloaded = 0
+                digest = hashlib.sha256()
+                stream_resumable = False  # Single-stream prefix is raw file bytes, so Range can continue it
+                completed_slices = set()  # Start offsets of finished slices in ranged mode
+                known_size = None
+                start_time = time.time()
                 
                 for attempt in range(max_retries):
-                    session = None
                     try:
                         # Update status
-                        self.parent.after(0, status_label.config, {'text': f'Connecting... (Attempt {attempt + 1}/{max_retries})'})
-                        
-                        # Use session for connection pooling and better performance
-                        session = requests.Session()
-                        session.headers.update({
-                            'User-Agent': 'GitToolSuite-Updater',
-                            'Accept-Encoding': 'gzip, deflate'
-                        })
-                        
-                        self.parent.after(0, speed_label.config, {'text': f'Requesting {download_url}...'})
-                        response = session.get(download_url, stream=True, timeout=30)
+                        show_status(f'Connecting... (Attempt {attempt + 1}/{max_retries})', f'Requesting {download_url}...')
+                        resume_from = downloaded if stream_resumable else 0
+                        headers = {'Range': f'bytes={resume_from}-', 'Accept-Encoding': 'identity'} if resume_from else None
+                        # (connect, read): the read timeout aborts the attempt once no data arrives for 10s
+                        response = _get_download_session().get(download_url, stream=True, timeout=(5, 10), headers=headers)
                         response.raise_for_status()
                         
-                        # Update status immediately after successful connection
-                        self.parent.after(0, status_label.config, {'text': 'Download starting...'})
-                        
                         # Get total file size
-                        total_size = int(response.headers.get('content-length', 0))
+                        if resume_from and response.status_code == 206:
+                            # Content-Range: bytes <start>-<end>/<total>
+                            total_size = int(response.headers.get('Content-Range', '').rpartition('/')[2] or 0)
+                        else:
+                            resume_from = 0  # Full body: start the stream over
+                            total_size = int(response.headers.get('content-length', 0))
+                        if not resume_from:
+                            downloaded = 0
+                            digest = hashlib.sha256()
+                            stream_resumable = False
+                        if total_size != known_size:
+                            completed_slices.clear()  # Different file; slices on disk no longer apply
+                            known_size = total_size
+                        
+                        # Ranges only line up with the file when the body is not content-encoded
+                        use_ranges = (not resume_from
+                                      and total_size >= 2 * RANGE_SLICE_SIZE
+                                      and response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+                                      and not response.headers.get('Content-Encoding'))
                         
                         if total_size > 0:
-                            self.parent.after(0, progress_bar.config, {'maximum': total_size})
-                            self.parent.after(0, status_label.config, {'text': f'Downloading ({total_size/(1024*1024):.1f} MB)...'})
-                            self.parent.after(0, speed_label.config, {'text': 'Initializing...'})
+                            show_status(f'Downloading ({total_size/(1024*1024):.1f} MB)...',
+                                        'Resuming...' if resume_from or completed_slices else 'Initializing...',
+                                        maximum=total_size)
                         else:
                             # No content-length header - use indeterminate mode
-                            self.parent.after(0, progress_bar.config, {'mode': 'indeterminate'})
-                            self.parent.after(0, progress_bar, 'start')
-                            self.parent.after(0, status_label.config, {'text': 'Downloading...'})
-                            self.parent.after(0, speed_label.config, {'text': 'Size unknown, downloading...'})
+                            show_status('Downloading...', 'Size unknown, downloading...', mode='indeterminate')
                         
                         # Save to temp file with progress tracking
-                        temp_zip = Path(tempfile.gettempdir()) / "GitToolSuite_update.zip"
-                        downloaded = 0
-                        last_ui_update = 0
-                        start_time = time.time()
+                        chunk_size = base_chunk_size
+                        recent_reads = deque(maxlen=8)  # (bytes, seconds) of the last reads
                         
-                        # Use larger buffer for file writes
-                        with open(temp_zip, 'wb', buffering=chunk_size) as f:
-                            for chunk in response.iter_content(chunk_size=chunk_size):
-                                if chunk:
-                                    f.write(chunk)
-                                    downloaded += len(chunk)
+                        # Unbuffered fd, pre-allocated to the expected size for a contiguous file.
+                        # Only truncated when nothing on disk is being resumed.
+                        flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+                        if not (resume_from or (use_ranges and completed_slices)):
+                            flags |= os.O_TRUNC
+                        fd = os.open(temp_zip, flags, 0o644)
+                        try:
+                            if total_size > 0:
+                                try:
+                                    if hasattr(os, 'posix_fallocate'):
+                                        os.posix_fallocate(fd, 0, total_size)
+                                    else:
+                                        os.ftruncate(fd, total_size)
+                                except OSError:
+                                    pass  # Pre-allocation is only an optimization
+                            
+                            if use_ranges:
+                                response.close()
+                                progress_lock = threading.Lock()
+                                downloaded = sum(min(RANGE_SLICE_SIZE, total_size - start) for start in completed_slices)
+                                
+                                def on_range_bytes(count):
+                                    nonlocal downloaded
+                                    with progress_lock:
+                                        downloaded += count
+                                        current = downloaded
+                                    elapsed = time.time() - start_time
+                                    if elapsed > 0:
+                                        publish_progress((current, total_size, elapsed))
+                                
+                                try:
+                                    _download_ranges(download_url, fd, total_size, on_range_bytes, completed_slices)
+                                    downloaded = total_size
+                                except _RangesUnsupported:
+                                    # Server ignored Range; start over with a single stream
+                                    use_ranges = False
+                                    downloaded = 0
+                                    completed_slices.clear()
+                                    response = _get_download_session().get(download_url, stream=True, timeout=(5, 10))
+                                    response.raise_for_status()
+                                except Exception:
+                                    # Bytes of unfinished slices are refetched; only whole slices count on retry
+                                    downloaded = 0
+                                    raise
+                            
+                            if not use_ranges:
+                                stream_resumable = not response.headers.get('Content-Encoding')
+                                os.lseek(fd, downloaded, os.SEEK_SET)
+                                # Read the raw stream directly (like shutil.copyfileobj) but keep progress reporting
+                                response.raw.decode_content = True
+                                read_started = time.perf_counter()
+                                for chunk in iter(lambda: response.raw.read(chunk_size), b''):
+                                    if chunk:
+                                        # Throughput over the recent window (size-weighted harmonic mean of per-read speeds)
+                                        now = time.perf_counter()
+                                        recent_reads.append((len(chunk), now - read_started))
+                                        read_started = now
+                                        window_time = sum(seconds for _, seconds in recent_reads)
+                                        if window_time > 0:
+                                            throughput = sum(size for size, _ in recent_reads) / window_time
+                                            chunk_size = max_chunk_size if throughput > fast_throughput else base_chunk_size
+                                    
+                                        digest.update(chunk)
+                                        view = memoryview(chunk)
+                                        while view:
+                                            view = view[os.write(fd, view):]
+                                        downloaded += len(chunk)
                                     
-                                    # Only update UI every update_interval bytes to reduce overhead
-                                    if downloaded - last_ui_update >= update_interval or downloaded >= total_size:
-                                        last_ui_update = downloaded
-                                        
-                                        # Calculate speed and progress
+                                        # Publish only the latest progress; drain_progress redraws from it
                                         elapsed = time.time() - start_time
                                         if elapsed > 0:
-                                            speed = downloaded / elapsed / (1024 * 1024)  # MB/s
-                                            
-                                            if total_size > 0:
-                                                percent = (downloaded / total_size) * 100
-                                                remaining = (total_size - downloaded) / (downloaded / elapsed) if downloaded > 0 else 0
-                                                
-                                                status_text = f"Downloaded {downloaded/(1024*1024):.1f} MB / {total_size/(1024*1024):.1f} MB ({percent:.0f}%)"
-                                                speed_text = f"{speed:.1f} MB/s - ~{remaining:.0f}s remaining"
-                                            else:
-                                                status_text = f"Downloaded {downloaded/(1024*1024):.1f} MB"
-                                                speed_text = f"{speed:.1f} MB/s"
-                                            
-                                            # Update UI
-                                            self.parent.after(0, progress_bar.config, {'value': downloaded})
-                                            self.parent.after(0, status_label.config, {'text': status_text})
-                                            self.parent.after(0, speed_label.config, {'text': speed_text})
+                                            publish_progress((downloaded, total_size, elapsed))
+                                # Content-Length can differ from the decoded size; trim any unused pre-allocation
+                                os.ftruncate(fd, downloaded)
+                        finally:
+                            os.close(fd)
+                        
+                        response.close()
                         
-                        # Close session
-                        if session:
-                            session.close()
+                        if use_ranges and expected_sha256:
+                            # Slices arrive out of order, so hash the finished file
+                            with open(temp_zip, 'rb') as f:
+                                for block in iter(lambda: f.read(1024 * 1024), b''):
+                                    digest.update(block)
                         
-                        # Download successful
-                        self.parent.after(0, status_label.config, {'text': 'Download complete!'})
-                        self.parent.after(0, speed_label.config, {'text': 'Preparing to update...'})
+                        if expected_sha256 and digest.hexdigest().lower() != expected_sha256.strip().lower():
+                            os.remove(temp_zip)
+                            show_error("Update Error",
+                                       "The downloaded update failed its integrity check (SHA-256 mismatch).\n\n"
+                                       "Please download it manually from:\n"
+                                       "https://github.com/tan-mike/git-tool-suite/releases")
+                            return
                         
-                        # Close progress window
+                        # Download successful - close progress window
                         self.parent.after(0, progress_window.destroy)
                         
                         # Launch updater
@@ -447,10 +789,10 @@ class SettingsApp(CenteredDialog):
                         if sys.platform != 'win32':
                              os.chmod(updater_exe, 0o755)
 
-                        # Start updater process directly
+                        # Start updater process directly; it waits for this PID to exit before replacing files
                         subprocess.Popen(
-                            [str(updater_exe), str(current_exe), str(temp_zip)],
-                            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+                            [str(updater_exe), str(current_exe), str(temp_zip), str(os.getpid())],
+                            creationflags=_POPEN_FLAGS
                         )
                         
                         # Show message and exit
@@ -463,41 +805,22 @@ class SettingsApp(CenteredDialog):
                         # Success - exit retry loop
                         break
                         
-                    except requests.RequestException as e:
-                        # Close session on error
-                        if session:
-                            try:
-                                session.close()
-                            except:
-                                pass
-                        
+                    except (requests.RequestException, RawStreamError) as e:
+                        # Read timeouts on the raw stream come from urllib3, not requests
                         if attempt < max_retries - 1:
                             # Retry
-                            error_msg = str(e)[:100]
-                            self.parent.after(0, status_label.config, {'text': f'Download failed, retrying...'})
-                            self.parent.after(0, speed_label.config, {'text': f'Error: {error_msg}'})
-                            time.sleep(2)
+                            show_status('Download failed, retrying...', f'Error: {str(e)[:100]}')
+                            time.sleep(2 ** attempt)  # Back off 1s, 2s, ... before resuming
                         else:
                             # All retries exhausted
-                            self.parent.after(0, progress_window.destroy)
-                            error_msg = f"Failed to download update after {max_retries} attempts:\n{e}"
-                            self.parent.after(0, lambda: messagebox.showerror("Download Error", error_msg))
+                            show_error("Download Error", f"Failed to download update after {max_retries} attempts:\n{e}")
                     
                     except Exception as e:
-                        # Close session on error
-                        if session:
-                            try:
-                                session.close()
-                            except:
-                                pass
-                        
                         # Unexpected error
-                        self.parent.after(0, progress_window.destroy)
-                        error_msg = f"Unexpected error during download:\n{type(e).__name__}: {e}"
-                        self.parent.after(0, lambda: messagebox.showerror("Download Error", error_msg))
+                        show_error("Download Error", f"Unexpected error during download:\n{type(e).__name__}: {e}")
                         break
             
-            threading.Thread(target=download, daemon=True).start()
+            _EXECUTOR.submit(download)
             
         except Exception as e:
             messagebox.showerror("Update Error", f"Failed to start update:\n{e}")
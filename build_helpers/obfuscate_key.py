@@ -5,13 +5,15 @@ Run this before building the executable to inject the obfuscated API key.
 
 Usage:
     1. Add GEMINI_API_KEY to .env file OR set environment variable
-    2. Run: python build_helpers/obfuscate_key.py
+    2. Run: python build_helpers/obfuscate_key.py [--product-key KEY]
     3. Build: pyinstaller --onefile --windowed main.py
 """
 
+import argparse
 import base64
 import hashlib
 import os
+import re
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -21,17 +23,18 @@ env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
 
+# Salt derived from app metadata (must match config.py); computed once at import
+_SALT = sum("GitToolSuite_v3.0".encode('utf-8')) & 0xFF  # = 50
+_XOR_TABLE = bytes(i ^ _SALT for i in range(256))
+
+
 def obfuscate_key(api_key):
     """
     Multi-layer obfuscation of API key.
     Returns three fragments for storage.
     """
-    # Compute salt (must match config.py)
-    salt_source = "GitToolSuite_v3.0"
-    salt = sum(ord(c) for c in salt_source) & 0xFF
-    
-    # XOR with salt
-    xored = bytes([ord(c) ^ salt for c in api_key])
+    # XOR with salt (one C-level pass through the lookup table)
+    xored = api_key.encode('utf-8').translate(_XOR_TABLE)
     
     # Base64 encode
     encoded = base64.b64encode(xored).decode('utf-8')
@@ -45,37 +48,32 @@ def obfuscate_key(api_key):
     return part1, part2, part3
 
 
+_KEY_PART_RE = re.compile(r'_KEY_PART([123]) = "PLACEHOLDER_PART\1"')
+_PRODUCT_KEY_HASH_RE = re.compile(r'_PRODUCT_KEY_HASH = "PLACEHOLDER_PRODUCT_KEY_HASH"')
+
+
 def inject_into_config(part1, part2, part3, product_key_hash=None):
     """Updates config.py with obfuscated key fragments and product key hash."""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config.py')
-    
-    # Read current config
-    with open(config_path, 'r') as f:
-        lines = f.readlines()
+    config_path = Path(__file__).parent.parent / 'config.py'
+    parts = (part1, part2, part3)
     
-    # Find and replace the placeholder lines
-    new_lines = []
-    for line in lines:
-        if '_KEY_PART1 = "PLACEHOLDER_PART1"' in line:
-            new_lines.append(f'    _KEY_PART1 = "{part1}"\n')
-        elif '_KEY_PART2 = "PLACEHOLDER_PART2"' in line:
-            new_lines.append(f'    _KEY_PART2 = "{part2}"\n')
-        elif '_KEY_PART3 = "PLACEHOLDER_PART3"' in line:
-            new_lines.append(f'    _KEY_PART3 = "{part3}"\n')
-        elif product_key_hash and '_PRODUCT_KEY_HASH = "PLACEHOLDER_PRODUCT_KEY_HASH"' in line:
-            new_lines.append(f'    _PRODUCT_KEY_HASH = "{product_key_hash}"\n')
-        else:
-            new_lines.append(line)
+    # Replace the placeholders in a single pass over the file
+    text = config_path.read_text()
+    text = _KEY_PART_RE.sub(lambda m: f'_KEY_PART{m.group(1)} = "{parts[int(m.group(1)) - 1]}"', text)
+    if product_key_hash:
+        text = _PRODUCT_KEY_HASH_RE.sub(f'_PRODUCT_KEY_HASH = "{product_key_hash}"', text)
     
-    # Write back
-    with open(config_path, 'w') as f:
-        f.writelines(new_lines)
+    config_path.write_text(text)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Inject the obfuscated API key into config.py")
+    parser.add_argument('--product-key', help="Product key for a Limited Edition build (overrides PRODUCT_KEY)")
+    args = parser.parse_args()
+    
     # Try to read from .env file first, then environment variable
     api_key = os.getenv('GEMINI_API_KEY')
-    product_key = os.getenv('PRODUCT_KEY')
+    product_key = args.product_key or os.getenv('PRODUCT_KEY')
     
     if not api_key:
         print("ERROR: GEMINI_API_KEY not found")
@@ -4,13 +4,75 @@ Handles API key storage (bundled) and user preferences.
 """
 
 import base64
+import copy
 import hashlib
+import hmac
 import json
 import os
+import threading
+from functools import lru_cache
+import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
-load_dotenv()
+# Frozen builds never ship a .env, so only development runs pay for dotenv
+if not getattr(sys, 'frozen', False):
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent / '.env')
+
+try:
+    import orjson  # Optional, C-backed serialisation
+    
+    def _dump_prefs(prefs):
+        return orjson.dumps(prefs, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_prefs(prefs):
+        return json.dumps(prefs, indent=2).encode('utf-8')
+
+# Salt derived from app metadata (must match obfuscation script); computed once at import
+_SALT = sum("GitToolSuite_v3.0".encode('utf-8')) & 0xFF  # = 50
+_XOR_TABLE = bytes(i ^ _SALT for i in range(256))
+
+
+# Preferences used until a preferences file exists (callers get a deep copy)
+_DEFAULT_PREFS = {
+    "theme": "dark",
+    "last_repo_path": "",
+    "product_key": "",
+    "propagator": {
+        "max_commits": 50,
+        "auto_push": False
+    },
+    "cleanup": {
+        "default_prefix": "feature/",
+        "default_days": 30,
+        "delete_scope": "both"
+    },
+    "pr_creator": {
+        "default_target": "main"
+    },
+    "branch_refresh": {
+        "tracked_repos": {},  # Dict: {"/path/to/repo": ["branch1", "branch2"]}
+        "refresh_interval_hours": 24,
+        "auto_refresh_enabled": False
+    },
+    "worktree": {
+        "base_path": "~/worktrees",
+        "editor_command": "",
+        "profiles": {}
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def _decode_fragments(combined):
+    """Base64-decode and un-XOR the joined key fragments (constant per build, so cached)."""
+    return base64.b64decode(combined).translate(_XOR_TABLE).decode('utf-8')
+
+
+@lru_cache(maxsize=8)
+def _hash_product_key(user_key):
+    """SHA-256 digest of a stripped product key; the stored key rarely changes, so results are cached."""
+    return hashlib.sha256(user_key.strip().encode('utf-8')).digest()
 
 
 class Config:
@@ -24,6 +86,12 @@ class Config:
     _CONFIG_DIR = Path.home() / '.git-tool-suite'
     _PREFS_FILE = _CONFIG_DIR / 'preferences.json'
     
+    # Last loaded preferences and the file mtime they were read at
+    _prefs_cache = None
+    _prefs_mtime = None
+    _prefs_lock = threading.Lock()
+    _config_dir_ready = False
+    
     # App Metadata
     APP_VERSION = "3.6.0"
     IS_LIMITED_BUILD = True # Set to True for builds without API key setup
@@ -32,6 +100,8 @@ class Config:
     # Product Key Hash (will be replaced by build script)
     # This is the SHA-256 hash of the actual product key from .env
     _PRODUCT_KEY_HASH = "2f08cd79dd44a90d9b77925ccc1389184933bea62b06752c7855f13187447415"
+    # Raw digest for constant-time comparison (None until the build injects a hash)
+    _PRODUCT_KEY_DIGEST = None if "PLACEHOLDER" in _PRODUCT_KEY_HASH else bytes.fromhex(_PRODUCT_KEY_HASH)
 
     @staticmethod
     def get_api_key():
@@ -47,12 +117,14 @@ class Config:
         if env_key:
             return env_key
             
+        # One preferences load serves both the edition check and the user key
+        prefs = Config.load_preferences()
+        
         # Check if Limited Edition is active
-        is_limited = Config.is_limited_edition()
+        is_limited = Config.validate_product_key(prefs.get('product_key', ''))
             
         # Priority 2: User Preferences 
         # (Always check prefs if NOT limited edition, or if user wants to override)
-        prefs = Config.load_preferences()
         user_key = prefs.get('api_key')
         
         # If user has a key and we are NOT limited edition, use it.
@@ -89,14 +161,11 @@ class Config:
             return False
         
         # Check if hash has been injected (not placeholder)
-        if "PLACEHOLDER" in Config._PRODUCT_KEY_HASH:
+        if Config._PRODUCT_KEY_DIGEST is None:
             return False
         
-        # Compute SHA-256 hash of user input
-        user_hash = hashlib.sha256(user_key.strip().encode('utf-8')).hexdigest()
-        
-        # Compare with embedded hash
-        return user_hash == Config._PRODUCT_KEY_HASH
+        # Compare the SHA-256 of the user input with the embedded hash in constant time
+        return hmac.compare_digest(_hash_product_key(user_key), Config._PRODUCT_KEY_DIGEST)
     
     @staticmethod
     def is_limited_edition():
@@ -109,72 +178,69 @@ class Config:
     def _decode_bundled_key():
         """Multi-layer de-obfuscation of bundled API key."""
         try:
-            # Combine fragments
+            # Combine fragments, then base64-decode and XOR with salt
             combined = Config._KEY_PART1 + Config._KEY_PART2 + Config._KEY_PART3
-            
-            # Compute salt from app metadata (must match obfuscation script)
-            salt_source = "GitToolSuite_v3.0"
-            salt = sum(ord(c) for c in salt_source) & 0xFF
-            
-            #Base64 decode
-            decoded = base64.b64decode(combined)
-            
-            # XOR with salt
-            unxored = bytes([b ^ salt for b in decoded])
-            
-            return unxored.decode('utf-8')
+            return _decode_fragments(combined)
         except Exception as e:
             print(f"ERROR decoding API key: {e}")
             return None
     
+    @staticmethod
+    def _ensure_config_dir():
+        """Create the config directory once per process instead of on every access."""
+        if not Config._config_dir_ready:
+            Config._CONFIG_DIR.mkdir(exist_ok=True)
+            Config._config_dir_ready = True
+    
     @staticmethod
     def load_preferences():
-        """Load user preferences from config file."""
-        Config._CONFIG_DIR.mkdir(exist_ok=True)
+        """
+        Load user preferences from config file.
+        The parsed file is cached until its mtime changes; callers get their own copy.
+        """
+        Config._ensure_config_dir()
+        
+        try:
+            mtime = Config._PREFS_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime = None
         
-        if Config._PREFS_FILE.exists():
+        if mtime is not None:
+            if Config._prefs_cache is not None and Config._prefs_mtime == mtime:
+                return copy.deepcopy(Config._prefs_cache)
             try:
-                with open(Config._PREFS_FILE, 'r') as f:
-                    return json.load(f)
+                # One read of the raw bytes; json decodes UTF-8 itself
+                prefs = json.loads(Config._PREFS_FILE.read_bytes())
+                Config._prefs_cache = prefs
+                Config._prefs_mtime = mtime
+                return copy.deepcopy(prefs)
             except Exception as e:
                 print(f"Error loading preferences: {e}")
         
         # Return default preferences
-        return {
-            "theme": "dark",
-            "last_repo_path": "",
-            "product_key": "",
-            "propagator": {
-                "max_commits": 50,
-                "auto_push": False
-            },
-            "cleanup": {
-                "default_prefix": "feature/",
-                "default_days": 30,
-                "delete_scope": "both"
-            },
-            "pr_creator": {
-                "default_target": "main"
-            },
-            "branch_refresh": {
-                "tracked_repos": {},  # Dict: {"/path/to/repo": ["branch1", "branch2"]}
-                "refresh_interval_hours": 24,
-                "auto_refresh_enabled": False
-            },
-            "worktree": {
-                "base_path": "~/worktrees",
-                "editor_command": "",
-                "profiles": {}
-            }
-        }
+        return copy.deepcopy(_DEFAULT_PREFS)
     
     @staticmethod
     def save_preferences(prefs):
-        """Save user preferences to config file."""
-        Config._CONFIG_DIR.mkdir(exist_ok=True)
+        """
+        Save user preferences to config file.
+        Writes to a temp file and renames it into place; skips the write if nothing changed.
+        Safe to call from a background thread.
+        """
+        Config._ensure_config_dir()
         
-        try:
-            with open(Config._PREFS_FILE, 'w') as f:
-                json.dump(prefs, f, indent=2)
-        except Exception as e:
-            print(f"Error saving preferences: {e}")
+        with Config._prefs_lock:
+            try:
+                if prefs == Config._prefs_cache and Config._prefs_mtime == Config._PREFS_FILE.stat().st_mtime_ns:
+                    return
+            except OSError:
+                pass
+            
+            try:
+                tmp_file = Config._PREFS_FILE.with_suffix('.json.tmp')
+                tmp_file.write_bytes(_dump_prefs(prefs))
+                os.replace(tmp_file, Config._PREFS_FILE)
+                Config._prefs_cache = copy.deepcopy(prefs)
+                Config._prefs_mtime = Config._PREFS_FILE.stat().st_mtime_ns
+            except Exception as e:
+                print(f"Error saving preferences: {e}")
@@ -1,18 +1,22 @@
 
 import os
 import shutil
-from git import Repo, Actor
+import subprocess
+import tempfile
 import time
 
 def create_dummy_repo(path):
-    if os.path.exists(path):
-        shutil.rmtree(path)
-    os.makedirs(path)
+    # GitPython is slow to import, so load it only when a repo is actually built
+    from git import Repo
+    
+    # Callers pass a path inside a fresh temp dir, so there is nothing to delete first
+    os.makedirs(path, exist_ok=True)
     repo = Repo.init(path)
     return repo
 
-def debug_refs():
-    base_path = os.path.abspath("debug_repo_test")
+def debug_refs(base_path):
+    from git import Repo
+    
     remote_path = os.path.join(base_path, "remote")
     local_path = os.path.join(base_path, "local")
 
@@ -25,8 +29,6 @@ def debug_refs():
     remote_repo.create_head("feature/old-remote")
     
     # Clone to local
-    if os.path.exists(local_path):
-        shutil.rmtree(local_path)
     local_repo = Repo.clone_from(remote_path, local_path)
     
     # Create a local branch that is NOT on remote
@@ -36,29 +38,35 @@ def debug_refs():
     # Checkout it to make it a local head too
     local_repo.create_head("feature/old-remote", "origin/feature/old-remote")
 
+    # One for-each-ref call instead of a GitPython object per ref
+    refs = subprocess.check_output(
+        ['git', '-C', local_path, 'for-each-ref', '--format=%(refname)'],
+        text=True
+    ).splitlines()
+
     print("--- Refs in Local Repo ---")
-    for ref in local_repo.refs:
-        print(f"Ref: {ref.name}, Type: {type(ref)}")
+    for ref in refs:
+        print(f"Ref: {ref.split('/', 2)[-1]}, Kind: {ref.split('/')[1]}")
 
     print("\n--- Heads (Local Branches) ---")
-    for head in local_repo.heads:
-        print(f"Head: {head.name}")
+    for ref in refs:
+        if ref.startswith("refs/heads/"):
+            print(f"Head: {ref[len('refs/heads/'):]}")
 
     print("\n--- Remotes ---")
     for remote in local_repo.remotes:
         print(f"Remote: {remote.name}")
-        for ref in remote.refs:
-             print(f"  Remote Ref: {ref.name}")
+        prefix = f"refs/remotes/{remote.name}/"
+        for ref in refs:
+            if ref.startswith(prefix):
+                print(f"  Remote Ref: {ref[len('refs/remotes/'):]}")
 
 if __name__ == "__main__":
+    base_path = tempfile.mkdtemp(prefix="gts_debug_")
     try:
-        debug_refs()
+        debug_refs(base_path)
     except Exception as e:
         print(f"Error: {e}")
     finally:
         # Cleanup
-        if os.path.exists("debug_repo_test"):
-            try:
-                shutil.rmtree("debug_repo_test")
-            except:
-                pass
+        shutil.rmtree(base_path, ignore_errors=True)
@@ -10,6 +10,8 @@ import subprocess
 import argparse
 import zipfile
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from config import Config
 
@@ -39,6 +41,22 @@ def generate_version_json():
     return version_data
 
 
+# PyInstaller output goes here instead of being held in memory
+BUILD_LOG_DIR = Path('build') / 'logs'
+
+# Per-build PyInstaller caches (PYINSTALLER_CONFIG_DIR), so concurrent builds never share one;
+# removed with build/ on a clean build, kept for --incremental
+PYINSTALLER_CACHE_DIR = Path('build') / 'pyinstaller-cache'
+
+# Resolved tool paths, so repeated checks in one invocation skip the PATH walk
+_tool_paths = {}
+
+def _which(tool):
+    if tool not in _tool_paths:
+        _tool_paths[tool] = shutil.which(tool)
+    return _tool_paths[tool]
+
+
 def check_prerequisites():
     """Check that required tools are installed."""
     print("\n=== Checking Prerequisites ===")
@@ -49,9 +67,13 @@ def check_prerequisites():
         'git': 'Git (for tagging)'
     }
     
+    # The PATH walks are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(tools)) as pool:
+        found = dict(zip(tools, pool.map(_which, tools)))
+    
     missing = []
     for tool, description in tools.items():
-        if shutil.which(tool):
+        if found[tool]:
             print(f"[OK] {description}")
         else:
             print(f"[ERR] {description} not found")
@@ -78,9 +100,20 @@ def check_git_status():
     print("\n=== Checking Git Status ===")
     
     try:
-        # Check for uncommitted changes
+        # Fast path: compare the index and tracked files against HEAD without walking
+        # untracked files (dist/, build/, __pycache__/). Refresh stale stat info first
+        # so diff-index doesn't report files that were only touched.
+        subprocess.run(['git', 'update-index', '-q', '--refresh'], capture_output=True)
+        dirty = subprocess.run(['git', 'diff-index', '--quiet', 'HEAD', '--'], capture_output=True)
+        if dirty.returncode not in (0, 1):
+            raise subprocess.CalledProcessError(dirty.returncode, dirty.args, stderr=dirty.stderr)
+        if dirty.returncode == 0:
+            print("[OK] Working directory clean")
+            return True
+
+        # Only list the changes when there is something to report
         result = subprocess.run(
-            ['git', 'status', '--porcelain'],
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
             capture_output=True,
             text=True,
             check=True
@@ -93,8 +126,6 @@ def check_git_status():
             if response.lower() != 'y':
                 print("[ERR] Aborted")
                 return False
-        else:
-            print("[OK] Working directory clean")
         
         return True
         
@@ -103,32 +134,36 @@ def check_git_status():
         return False
 
 
+def _local_tag_exists(tag_name):
+    """Ask git whether the tag exists locally (works with any ref storage backend)."""
+    result = subprocess.run(['git', 'show-ref', '--verify', '--quiet', f'refs/tags/{tag_name}'])
+    return result.returncode == 0
+
+
 def check_version_not_released(version):
     """Check if version tag already exists."""
     print(f"\n=== Checking if v{version} already released ===")
     
     try:
-        # Check local tags
-        result = subprocess.run(
-            ['git', 'tag', '-l', f'v{version}'],
-            capture_output=True,
-            text=True,
-            check=True
+        # Start the remote lookup first so its network round-trip overlaps the local check
+        remote = subprocess.Popen(
+            ['git', 'ls-remote', '--tags', '--refs', 'origin', f'refs/tags/v{version}'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
         )
         
-        if result.stdout.strip():
+        # Check local tags
+        if _local_tag_exists(f'v{version}'):
             print(f"[WARN] Tag v{version} already exists locally (Continuing for multi-platform release)")
             # return False
         
         # Check remote tags
-        result = subprocess.run(
-            ['git', 'ls-remote', '--tags', 'origin', f'refs/tags/v{version}'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        remote_out, remote_err = remote.communicate()
+        if remote.returncode != 0:
+            raise subprocess.CalledProcessError(remote.returncode, remote.args, remote_out, remote_err)
         
-        if result.stdout.strip():
+        if remote_out.strip():
             print(f"[WARN] Tag v{version} already exists on remote (Continuing for multi-platform release)")
             # return False
         
@@ -140,15 +175,65 @@ def check_version_not_released(version):
         return True  # Continue anyway
 
 
-def build_application():
-    """Build the application using PyInstaller."""
+def build_application(incremental=False):
+    """
+    Build the application using PyInstaller.
+    With incremental=True, build/ and PyInstaller's analysis cache are reused.
+    """
     print("\n=== Building Application ===")
     
     # Clean previous builds
     print("Cleaning previous builds...")
     shutil.rmtree('dist', ignore_errors=True)
-    shutil.rmtree('build', ignore_errors=True)
+    if not incremental:
+        shutil.rmtree('build', ignore_errors=True)
+    clean_args = [] if incremental else ['--clean']
+    
+    # The updater is independent of the main app, so PyInstaller builds both at once.
+    # Each build has its own work directory and cache (see _run_pyinstaller), so --clean is safe in both.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        updater_future = pool.submit(build_updater, incremental)
+        exe_path = _build_main_app(clean_args)
+        updater_path = updater_future.result()
     
+    if not exe_path:
+        return None, None
+    return exe_path, updater_path
+
+
+def _run_pyinstaller(cmd, name, creation_flags):
+    """
+    Run PyInstaller with its output written straight to build/logs/<name>.log
+    (follow it with `tail -f` during long builds). Raises CalledProcessError on failure.
+    Each name gets its own cache directory, which is all --clean wipes.
+    """
+    BUILD_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    env = {**os.environ, 'PYINSTALLER_CONFIG_DIR': str((PYINSTALLER_CACHE_DIR / name).resolve())}
+    with open(BUILD_LOG_DIR / f'{name}.log', 'wb') as log:
+        subprocess.run(
+            cmd,
+            check=True,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            creationflags=creation_flags,
+            env=env
+        )
+
+
+def _print_log_tail(name, size=4096):
+    """Print the end of a PyInstaller log, where the error is."""
+    log_path = BUILD_LOG_DIR / f'{name}.log'
+    try:
+        with open(log_path, 'rb') as log:
+            log.seek(max(0, log_path.stat().st_size - size))
+            print(log.read().decode('utf-8', errors='replace'))
+        print(f"Full log: {log_path}")
+    except OSError as e:
+        print(f"Could not read {log_path}: {e}")
+
+
+def _build_main_app(clean_args):
+    """Run PyInstaller for GitToolSuite; returns the built path or None."""
     spec_file = Path('GitToolSuite.spec')
     # If spec file is missing, we will run pyinstaller with args
     use_spec = spec_file.exists()
@@ -163,10 +248,10 @@ def build_application():
         
         cmd = ['pyinstaller']
         if use_spec:
-             cmd.extend(['GitToolSuite.spec', '--clean'])
+             cmd.extend(['GitToolSuite.spec', *clean_args])
         else:
              # Fallback command if spec is missing
-             cmd.extend(['--onefile', '--windowed', '--name', 'GitToolSuite', 'main.py', '--clean'])
+             cmd.extend(['--onefile', '--windowed', '--name', 'GitToolSuite', 'main.py', *clean_args])
 
              # Add icon if exists
              icon_path = Path('assets/git_tools_suite.ico')
@@ -183,19 +268,12 @@ def build_application():
                  else:
                       cmd.append(f'--icon={icon_path}')
 
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            creationflags=creation_flags
-        )
-        # print(result.stdout)
+        _run_pyinstaller(cmd, 'GitToolSuite', creation_flags)
         
     except subprocess.CalledProcessError as e:
         print(f"[ERR] Build failed: {e}")
-        print(e.stderr)
-        return None, None
+        _print_log_tail('GitToolSuite')
+        return None
     
     # Verify main output
     # On Mac with --windowed, it creates a .app bundle
@@ -208,7 +286,7 @@ def build_application():
 
     if not exe_path.exists():
         print(f"[ERR] Build failed - executable not found at {exe_path}")
-        return None, None
+        return None
     
     # Calculate size (folder size if .app)
     if exe_path.is_dir():
@@ -217,16 +295,13 @@ def build_application():
          file_size = exe_path.stat().st_size / (1024 * 1024)  # MB
 
     print(f"[OK] Main application built: {exe_path} ({file_size:.2f} MB)")
-
-    # Build updater
-    updater_path = build_updater()
-    
-    return exe_path, updater_path
+    return exe_path
 
 
-def build_updater():
+def build_updater(incremental=False):
     """Build updater executable using PyInstaller."""
     print("\nBuilding updater executable...")
+    clean_args = [] if incremental else ['--clean']
     
     spec_file = Path('updater.spec')
     use_spec = spec_file.exists()
@@ -239,17 +314,11 @@ def build_updater():
             
         cmd = ['pyinstaller']
         if use_spec:
-             cmd.extend(['updater.spec', '--clean'])
+             cmd.extend(['updater.spec', *clean_args])
         else:
-             cmd.extend(['--onefile', '--console', '--name', 'updater', 'updater.py', '--clean'])
+             cmd.extend(['--onefile', '--console', '--name', 'updater', 'updater.py', *clean_args])
 
-        subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
-            creationflags=creation_flags
-        )
+        _run_pyinstaller(cmd, 'updater', creation_flags)
         
         if sys.platform == 'win32':
              updater_path = Path('dist/updater.exe')
@@ -266,9 +335,18 @@ def build_updater():
             
     except subprocess.CalledProcessError as e:
         print(f"[ERR] Updater build failed: {e}")
+        _print_log_tail('updater')
         return None
 
 
+def _add_to_zip(zf, file_path, arcname):
+    """Copy a file into the archive in 1 MiB blocks (zf.write uses 8 KiB reads)."""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)  # Keeps mtime and executable bits
+    zinfo.compress_type = zf.compression
+    with open(file_path, 'rb') as src, zf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+
 def create_release_bundle(version, exe_path, updater_path):
     """Package both executables into a single ZIP."""
     # Platform specific naming
@@ -282,7 +360,9 @@ def create_release_bundle(version, exe_path, updater_path):
     
     print(f"\nCreating release bundle: {bundle_name}")
     
-    with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+    # PyInstaller executables are already compressed, so they are stored as-is;
+    # only the README is deflated (level 1: it is a few hundred bytes of text)
+    with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_STORED) as zf:
         # Add main app
         if exe_path.is_dir():
              # Recursive add for .app bundle
@@ -290,13 +370,13 @@ def create_release_bundle(version, exe_path, updater_path):
                  for file in files:
                      file_path = Path(root) / file
                      arcname = file_path.relative_to(exe_path.parent)
-                     zf.write(file_path, arcname)
+                     _add_to_zip(zf, file_path, arcname)
         else:
-             zf.write(exe_path, exe_path.name)
+             _add_to_zip(zf, exe_path, exe_path.name)
         
         # Add updater if exists
         if updater_path and updater_path.exists():
-            zf.write(updater_path, updater_path.name)
+            _add_to_zip(zf, updater_path, updater_path.name)
         
         # Add README
         readme = f"""Git Tool Suite v{version}
@@ -322,7 +402,7 @@ MORE INFO
 ---------
 GitHub: https://github.com/tan-mike/git-tool-suite
 """
-        zf.writestr('README.txt', readme)
+        zf.writestr('README.txt', readme, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
     
     size_mb = bundle_path.stat().st_size / (1024 * 1024)
     print(f"[OK] Bundle created: {bundle_path} ({size_mb:.2f} MB)")
@@ -336,18 +416,27 @@ def create_git_tag(version):
     tag_name = f"v{version}"
     
     try:
-        # Create tag
+        # Create tag (stderr is captured to recognise an existing tag)
         print(f"Creating tag {tag_name}...")
         subprocess.run(
             ['git', 'tag', '-a', tag_name, '-m', f'Release {tag_name}'],
-            check=True
+            check=True,
+            stderr=subprocess.PIPE,
+            text=True
         )
         print(f"[OK] Tag {tag_name} created locally")
-        
-        # Push tag
+    except subprocess.CalledProcessError as e:
+        if "already exists" in (e.stderr or ""):
+             print(f"[WARN] Tag already exists (expected for second platform)")
+             return True
+        print(f"[ERR] Failed to create tag: {e}")
+        return False
+    
+    try:
+        # Push tag: a full refspec can't be confused with a branch of the same name
         print(f"Pushing tag to origin...")
         subprocess.run(
-            ['git', 'push', 'origin', tag_name],
+            ['git', 'push', 'origin', f'refs/tags/{tag_name}'],
             check=True
         )
         print(f"[OK] Tag {tag_name} pushed to origin")
@@ -355,10 +444,7 @@ def create_git_tag(version):
         return True
         
     except subprocess.CalledProcessError as e:
-        if "already exists" in e.stderr:
-             print(f"[WARN] Tag already exists (expected for second platform)")
-             return True
-        print(f"[ERR] Failed to create/push tag: {e}")
+        print(f"[ERR] Failed to push tag: {e}")
         return False
 
 
@@ -383,6 +469,7 @@ See [CHANGELOG.md](https://github.com/tan-mike/git-tool-suite/blob/main/CHANGELO
 No installation required!
 """
     
+    notes_file = None
     try:
         # Check if release exists first
         print(f"Checking if release {tag_name} exists...")
@@ -400,11 +487,15 @@ No installation required!
         else:
             # Create new release
             print(f"Creating release {tag_name} with bundle...")
+            # Pass the notes as a file so long notes aren't limited by the command-line length (~32 KiB on Windows)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.md', delete=False) as tf:
+                tf.write(release_notes)
+                notes_file = tf.name
             cmd = [
                 'gh', 'release', 'create', tag_name,
                 str(bundle_path),
                 '--title', f'Git Tool Suite v{version}',
-                '--notes', release_notes,
+                '--notes-file', notes_file,
                 '--repo', 'tan-mike/git-tool-suite'
             ]
         
@@ -418,9 +509,12 @@ No installation required!
     except subprocess.CalledProcessError as e:
         print(f"[ERR] Failed to create/update GitHub release: {e}")
         return False
+    finally:
+        if notes_file:
+            os.unlink(notes_file)
 
 
-def run_build_only():
+def run_build_only(incremental=False):
     """Run build without creating a release."""
     print("\n" + "="*60)
     print(f"  BUILD ONLY - Version {Config.APP_VERSION}")
@@ -429,7 +523,7 @@ def run_build_only():
     if not check_prerequisites():
         return 1
     
-    exe_path, updater_path = build_application()
+    exe_path, updater_path = build_application(incremental)
     if not exe_path:
         return 1
     
@@ -523,6 +617,11 @@ def main():
         action='store_true',
         help='Build the application with PyInstaller'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='With --build, reuse the PyInstaller build cache instead of a clean build'
+    )
     parser.add_argument(
         '--release',
         action='store_true',
@@ -534,7 +633,7 @@ def main():
     if args.release:
         return run_full_release()
     elif args.build:
-        return run_build_only()
+        return run_build_only(args.incremental)
     else:
         # Default: just generate version.json
         generate_version_json()
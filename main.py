@@ -21,23 +21,81 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import datetime
+import json
+import os
+from collections import deque
 import sv_ttk
 import tkinter.font as tkfont
 
-# Import our modular components
-from apps.propagator import GitPropagatorApp
-from apps.cleanup import BranchCleanerApp
-from apps.pull_request import PullRequestApp
-from apps.commit_generator import CommitGeneratorApp
-from apps.branch_refresh import BranchRefreshApp
-from apps.worktree import WorktreeManagerApp
-from apps.settings import SettingsApp
+# Import our modular components (tab apps are imported when their tab is first shown)
+from apps.settings import SettingsApp, fetch_update_info
 from apps.guide import UserGuideDialog
 from ai.gemini_client import GeminiClient
 from config import Config
 from utils.versioning import is_newer_version
 
 
+# Space left for the taskbar/dock when sizing the main window.
+# Mac has a top menu bar (~22px) and a Dock (variable); winfo_screenheight is usually
+# the full screen including both, so a bigger buffer is reserved there.
+TASKBAR_HEIGHT = {'darwin': 100}.get(sys.platform, 60)
+
+# A launch-time update check newer than this is reused instead of asking GitHub again
+LAUNCH_UPDATE_CHECK_TTL = 6 * 60 * 60
+
+# Jokes fetched ahead of time so the button can answer without waiting on the API
+JOKE_CACHE_FILE = Config._CONFIG_DIR / 'cache' / 'jokes.json'
+JOKE_CACHE_SIZE = 20
+
+
+def _load_joke_cache():
+    try:
+        with open(JOKE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            jokes = json.load(f)
+        return deque((j for j in jokes if isinstance(j, str)), maxlen=JOKE_CACHE_SIZE)
+    except FileNotFoundError:
+        return deque(maxlen=JOKE_CACHE_SIZE)
+    except Exception as e:
+        print(f"Error loading joke cache: {e}")
+        return deque(maxlen=JOKE_CACHE_SIZE)
+
+
+# Tab app loaders. The imports are written out (not importlib strings) so PyInstaller still bundles them.
+def _load_propagator():
+    from apps.propagator import GitPropagatorApp
+    return GitPropagatorApp
+
+def _load_cleanup():
+    from apps.cleanup import BranchCleanerApp
+    return BranchCleanerApp
+
+def _load_pull_request():
+    from apps.pull_request import PullRequestApp
+    return PullRequestApp
+
+def _load_commit_generator():
+    from apps.commit_generator import CommitGeneratorApp
+    return CommitGeneratorApp
+
+def _load_branch_refresh():
+    from apps.branch_refresh import BranchRefreshApp
+    return BranchRefreshApp
+
+def _load_worktree():
+    from apps.worktree import WorktreeManagerApp
+    return WorktreeManagerApp
+
+# (tab title, attribute on GitToolsSuiteApp, loader) in notebook order
+TAB_SPECS = [
+    ('Commit Propagator', 'propagator_app', _load_propagator),
+    ('Branch Cleanup', 'cleanup_app', _load_cleanup),
+    ('Create Pull Request', 'pr_app', _load_pull_request),
+    ('Commit Tool', 'commit_app', _load_commit_generator),
+    ('Branch Refresh', 'branch_refresh_app', _load_branch_refresh),
+    ('Worktree Manager', 'worktree_app', _load_worktree),
+]
+
+
 class GitToolsSuiteApp:
     def __init__(self, root):
         self.root = root
@@ -68,18 +126,7 @@ class GitToolsSuiteApp:
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
         
-        # Account for taskbar/dock
-        if sys.platform == 'win32':
-             taskbar_height = 60
-        elif sys.platform == 'darwin':
-             # Mac has top menu bar (~22px) and Dock (variable).
-             # winfo_screenheight is usually full screen including dock/menu.
-             # Reasonable buffer
-             taskbar_height = 100
-        else:
-             taskbar_height = 60
-
-        usable_height = screen_height - taskbar_height
+        usable_height = screen_height - TASKBAR_HEIGHT
         
         # Calculate window size - 90% width, 85% of usable height
         window_width = min(int(screen_width * 0.9), 1400)
@@ -97,6 +144,9 @@ class GitToolsSuiteApp:
         self._set_window_icon()
 
         self.joke_result = None
+        self._joke_cache = _load_joke_cache()
+        self._joke_lock = threading.Lock()
+        self._joke_refill_running = False
         self.gemini_client = GeminiClient() if Config.get_api_key() else None
 
         # Bottom frame with joke button (Pack this FIRST to ensure visibility)
@@ -109,40 +159,21 @@ class GitToolsSuiteApp:
         # Create tabs
         self.notebook = ttk.Notebook(root)
         
-        tab_propagator = ttk.Frame(self.notebook)
-        tab_cleanup = ttk.Frame(self.notebook)
-        tab_pr_creator = ttk.Frame(self.notebook)
-        tab_commit = ttk.Frame(self.notebook)
-        tab_branch_refresh = ttk.Frame(self.notebook)
-        tab_worktree = ttk.Frame(self.notebook)
-        
-        self.notebook.add(tab_propagator, text='Commit Propagator')
-        self.notebook.add(tab_cleanup, text='Branch Cleanup')
-        self.notebook.add(tab_pr_creator, text='Create Pull Request')
-        self.notebook.add(tab_commit, text='Commit Tool')
-        self.notebook.add(tab_branch_refresh, text='Branch Refresh')
-        self.notebook.add(tab_worktree, text='Worktree Manager')
+        self.tab_frames = []
+        for title, attr, _ in TAB_SPECS:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self.tab_frames.append(frame)
+            setattr(self, attr, None)
         self.notebook.pack(expand=True, fill="both", pady=(0, 5))
 
         # Create Menu Bar
         self.create_menu_bar()
 
-        # Initialize app instances
-        self.propagator_app = GitPropagatorApp(tab_propagator)
-        self.cleanup_app = BranchCleanerApp(tab_cleanup)
-        self.pr_app = PullRequestApp(tab_pr_creator)
-        self.commit_app = CommitGeneratorApp(tab_commit)
-        self.branch_refresh_app = BranchRefreshApp(tab_branch_refresh)
-        self.worktree_app = WorktreeManagerApp(tab_worktree)
-
-        self.tab_apps = [
-            self.propagator_app, 
-            self.cleanup_app, 
-            self.pr_app, 
-            self.commit_app, 
-            self.branch_refresh_app, 
-            self.worktree_app
-        ]
+        # App instances are created the first time their tab is selected
+        self.tab_apps = [None] * len(TAB_SPECS)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._active_app = self._ensure_tab_app(0)
 
         if not self.gemini_client:
             self.joke_button.config(state=tk.DISABLED)
@@ -153,6 +184,18 @@ class GitToolsSuiteApp:
         # Auto-check for updates once on launch
         self.check_for_updates_on_launch()
     
+    def _on_tab_changed(self, event=None):
+        # Remember the visible app so log_to_active_tab needs no Tk calls (it also runs from worker threads)
+        self._active_app = self._ensure_tab_app(self.notebook.index(self.notebook.select()))
+
+    def _ensure_tab_app(self, index):
+        """Import and build a tab's app on first use, so startup only pays for the visible tab."""
+        if self.tab_apps[index] is None:
+            _, attr, load_app_class = TAB_SPECS[index]
+            self.tab_apps[index] = load_app_class()(self.tab_frames[index])
+            setattr(self, attr, self.tab_apps[index])
+        return self.tab_apps[index]
+
     def create_menu_bar(self):
         """Create the application menu bar."""
         menubar = tk.Menu(self.root)
@@ -223,7 +266,15 @@ class GitToolsSuiteApp:
         print("No custom icon found, using default")
 
     def tell_joke_threaded(self):
-        """Entry point for joke generation."""
+        """Entry point for joke generation. Serves a cached joke when one is available."""
+        with self._joke_lock:
+            joke = self._joke_cache.popleft() if self._joke_cache else None
+        if joke is not None:
+            self._save_joke_cache()
+            self.show_centered_popup("Here's a Joke!", joke)
+            self._refill_joke_cache_threaded()
+            return
+
         self.joke_button.config(state=tk.DISABLED)
         self.joke_result = None
 
@@ -244,32 +295,62 @@ class GitToolsSuiteApp:
         position_y = main_win_y + (main_win_height // 2) - (popup_height // 2)
         loading_popup.geometry(f"{popup_width}x{popup_height}+{position_x}+{position_y}")
 
-        self.root.after(50, self._start_joke_worker_and_poller, loading_popup)
+        self.root.after(50, self._start_joke_worker, loading_popup)
 
-    def _start_joke_worker_and_poller(self, loading_popup):
+    def _start_joke_worker(self, loading_popup):
         loading_popup.grab_set()
-        threading.Thread(target=self._tell_joke_worker, daemon=True).start()
-        self.check_for_joke_result(loading_popup)
+        threading.Thread(target=self._tell_joke_worker, args=(loading_popup,), daemon=True).start()
 
-    def _tell_joke_worker(self):
+    def _tell_joke_worker(self, loading_popup):
         """Background thread for generating a joke."""
         self.log_to_active_tab("Requesting a joke from the AI...")
-        self.joke_result = self.gemini_client.get_joke()
-
-    def check_for_joke_result(self, loading_popup):
-        """Polls for joke result."""
-        if self.joke_result is not None:
-            loading_popup.destroy()
-            if "Error:" not in self.joke_result:
-                self.show_centered_popup("Here's a Joke!", self.joke_result)
-            self.joke_button.config(state=tk.NORMAL)
-        else:
-            self.root.after(100, self.check_for_joke_result, loading_popup)
+        result = self.gemini_client.get_joke()
+        # Hand the result to the main thread once instead of having it poll for it
+        self.root.after(0, self._on_joke_ready, loading_popup, result)
+
+    def _on_joke_ready(self, loading_popup, result):
+        """Shows the fetched joke on the main thread."""
+        self.joke_result = result
+        loading_popup.destroy()
+        if "Error:" not in result:
+            self.show_centered_popup("Here's a Joke!", result)
+            self._refill_joke_cache_threaded()
+        self.joke_button.config(state=tk.NORMAL)
+
+    def _refill_joke_cache_threaded(self):
+        """Fetches the next joke in the background so the following click is instant."""
+        with self._joke_lock:
+            if self._joke_refill_running:
+                return
+            self._joke_refill_running = True
+        threading.Thread(target=self._refill_joke_cache_worker, daemon=True).start()
+
+    def _refill_joke_cache_worker(self):
+        try:
+            joke = self.gemini_client.get_joke()
+            if joke and "Error:" not in joke:
+                with self._joke_lock:
+                    self._joke_cache.append(joke)
+                self._save_joke_cache()
+        finally:
+            with self._joke_lock:
+                self._joke_refill_running = False
+
+    def _save_joke_cache(self):
+        with self._joke_lock:
+            jokes = list(self._joke_cache)
+        try:
+            JOKE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = JOKE_CACHE_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(jokes, f)
+            os.replace(tmp_file, JOKE_CACHE_FILE)
+        except Exception as e:
+            print(f"Error saving joke cache: {e}")
 
     def log_to_active_tab(self, message):
         try:
-            current_tab_index = self.notebook.index(self.notebook.select())
-            active_app = self.tab_apps[current_tab_index]
+            active_app = self._active_app
             if hasattr(active_app, 'log_message'):
                 active_app.log_message(message)
             elif hasattr(active_app, 'log'):
@@ -303,17 +384,25 @@ class GitToolsSuiteApp:
         ok_button = ttk.Button(frame, text="OK", command=popup.destroy)
         ok_button.pack()
         
+        # Typewriter effect in small batches: one insert and redraw per 8 characters
+        chunk_size = 8
+        
         def insert_text_safely(i=0):
             if not text_area.winfo_exists(): 
                 return
             if i < len(message):
-                text_area.insert(tk.END, message[i])
+                text_area.insert(tk.END, message[i:i + chunk_size])
                 text_area.see(tk.END)
-                text_area.after(10, insert_text_safely, i + 1)
+                text_area.after(40, insert_text_safely, i + chunk_size)
             else:
                 text_area.config(state=tk.DISABLED)
 
-        insert_text_safely()
+        if len(message) > 2000:
+            # Too long to animate; show it at once
+            text_area.insert(tk.END, message)
+            text_area.config(state=tk.DISABLED)
+        else:
+            insert_text_safely()
         popup.focus_force()
         popup.wait_window()
 
@@ -338,11 +427,11 @@ class GitToolsSuiteApp:
     
     def _update_check_worker(self):
         """Background worker to check for updates."""
-        import requests
         try:
-            response = requests.get(Config.UPDATE_CHECK_URL, timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            # stdlib urllib with the Settings cache: no requests import at startup, and a
+            # follow-up check from Settings reuses this response. Relaunches within
+            # LAUNCH_UPDATE_CHECK_TTL reuse the stored result without going to the network.
+            data = fetch_update_info(max_age=LAUNCH_UPDATE_CHECK_TTL)
             
             latest_version = data.get('version')
             release_url = data.get('release_url', "https://github.com/tan-mike/git-tool-suite/releases")
@@ -387,17 +476,17 @@ def cleanup_old_versions():
         else:
             base_path = Path(__file__).parent
             
-        # Find all files ending in .old
-        # Clean both .exe.old and .old files
-        patterns = ["*.exe.old", "*.old"]
-        for pattern in patterns:
-            for old_file in base_path.glob(pattern):
+        # Find all files ending in .old (this also covers .exe.old) in a single directory pass
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if not (entry.name.lower().endswith('.old') and entry.is_file()):
+                    continue
                 try:
-                    old_file.unlink()
-                    print(f"Cleaned up old version: {old_file.name}")
+                    os.unlink(entry.path)
+                    print(f"Cleaned up old version: {entry.name}")
                 except Exception as e:
                     # Retries will happen next launch
-                    print(f"Could not delete {old_file.name}: {e}")
+                    print(f"Could not delete {entry.name}: {e}")
                 
     except Exception as e:
         print(f"Error during cleanup: {e}")
@@ -408,9 +497,6 @@ def main():
     import tkinter as tk
     from tkinter import messagebox
     
-    # Run cleanup first thing
-    cleanup_old_versions()
-    
     # Check for GitPython dependency
     try:
         from git import Repo, exc
@@ -427,6 +513,8 @@ def main():
     
     root = tk.Tk()
     app = GitToolsSuiteApp(root)
+    # Delete leftovers from the last update off the UI thread so the window isn't held up by slow disks or AV scans
+    threading.Thread(target=cleanup_old_versions, daemon=True).start()
     root.mainloop()
 
 
@@ -0,0 +1,25 @@
+"""
+Lets pytest collect the verify_*.py checks, so they can all be run with `pytest tests/`,
+or in parallel with pytest-xdist: `pytest -n auto tests/`.
+Each check builds its own repository, so they are independent of each other.
+"""
+
+import pytest
+
+
+class VerifyModule(pytest.Module):
+    """Collects the unittest classes as usual, plus the script-style verify_*() functions."""
+
+    def funcnamefilter(self, name):
+        return super().funcnamefilter(name) or name.startswith("verify_")
+
+
+def pytest_collect_file(parent, file_path):
+    if file_path.suffix == ".py" and file_path.name.startswith("verify_"):
+        return VerifyModule.from_parent(parent, path=file_path)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Run each check in its own directory, so the repos it creates can't collide under xdist."""
+    monkeypatch.chdir(tmp_path)
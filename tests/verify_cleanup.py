@@ -1,12 +1,15 @@
 
-import os
 import sys
 from pathlib import Path
 import unittest
 from unittest.mock import patch, MagicMock
 
+# Project root (where main.py lives)
+_APP_DIR = Path(__file__).resolve().parent.parent
+
 # Add project root to sys.path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+if str(_APP_DIR) not in sys.path:
+    sys.path.insert(0, str(_APP_DIR))
 
 # Import the function to be tested
 # We need to import check_for_dependency from main, but since it's not exported, we might need a different approach
@@ -37,8 +40,7 @@ class TestCleanup(unittest.TestCase):
         # We need to place our test file in the SAME directory as main.py for the test to work without mocking too much.
         
         # Move test file to app root
-        app_dir = Path(__file__).parent.parent 
-        target_file = app_dir / "test_cleanup_logic.exe.old"
+        target_file = _APP_DIR / "test_cleanup_logic.exe.old"
         if self.test_file.exists():
              # Move current test file to target location
              self.test_file.rename(target_file)
@@ -1,6 +1,9 @@
 
+import atexit
 import os
 import shutil
+import tempfile
+import subprocess
 import datetime
 from git import Repo, Actor
 import sys
@@ -17,86 +20,61 @@ class MockBranchCleanerApp:
         
         # Copied logic from the fix
         candidates = {}
+        refs_output = self.repo.git.for_each_ref(
+            "--format=%(committerdate:unix) %(refname)", "refs/heads/", "refs/remotes/origin/"
+        )
+        for line in refs_output.splitlines():
+            timestamp, _, refname = line.partition(" ")
+            if refname.startswith("refs/heads/"):
+                name = refname[len("refs/heads/"):]
+            else:
+                name = refname[len("refs/remotes/origin/"):]
+            if name.startswith(prefix):
+                candidates[name] = max(candidates.get(name, 0), int(timestamp))
 
-        # 1. Local branches
-        for head in self.repo.heads:
-            if head.name.startswith(prefix):
-                if head.name not in candidates:
-                    candidates[head.name] = {}
-                candidates[head.name]['local'] = head
-
-        # 2. Remote branches (origin)
-        if 'origin' in self.repo.remotes:
-            for ref in self.repo.remotes.origin.refs:
-                remote_name = ref.name
-                if remote_name.startswith("origin/"):
-                    short_name = remote_name[7:]
-                    if short_name.startswith(prefix):
-                        if short_name not in candidates:
-                            candidates[short_name] = {}
-                        candidates[short_name]['remote'] = ref
-
-        for name, refs in candidates.items():
-            timestamps = []
-            if 'local' in refs:
-                timestamps.append(refs['local'].commit.committed_date)
-            if 'remote' in refs:
-                timestamps.append(refs['remote'].commit.committed_date)
-            
-            if not timestamps:
-                continue
-            
-            max_ts = max(timestamps)
+        for name, max_ts in candidates.items():
             commit_date = datetime.datetime.fromtimestamp(max_ts, datetime.timezone.utc)
             age_days = (now - commit_date).days
             
             if age_days >= days_limit:
                 self.branches_info.append((name, commit_date, age_days))
 
-def create_dummy_repo(path):
-    if os.path.exists(path):
-        shutil.rmtree(path)
-    os.makedirs(path)
-    repo = Repo.init(path)
-    return repo
-
 def verify_fix():
-    base_path = os.path.abspath("verify_repo_test")
+    # Fresh directory under the system temp dir (point TMPDIR at a RAM disk for faster runs)
+    base_path = tempfile.mkdtemp(prefix="verify_repo_test_")
+    atexit.register(shutil.rmtree, base_path, ignore_errors=True)
     remote_path = os.path.join(base_path, "remote")
     local_path = os.path.join(base_path, "local")
+    os.makedirs(remote_path)
 
-    # Create remote
-    remote_repo = create_dummy_repo(remote_path)
-    index = remote_repo.index
-    index.commit("Initial commit")
-    
-    # Create a branch on remote
-    remote_repo.create_head("feature/remote-only")
-    
-    # Clone to local
-    if os.path.exists(local_path):
-        shutil.rmtree(local_path)
-    local_repo = Repo.clone_from(remote_path, local_path)
-    
-    # Create a local branch that is NOT on remote
-    local_repo.create_head("feature/local-only")
-    
-    # Create a branch that exists on both (simulated by checking out remote branch)
-    local_repo.create_head("feature/both", "origin/feature/remote-only") # Actually let's name it 'both'
-    # Wait, to have it on remote, I need to push it or create it on remote first.
-    # Let's create 'feature/both' on remote first.
-    remote_repo.create_head("feature/both")
+    # Create remote: initial commit on master plus 'feature/remote-only' and 'feature/both',
+    # written by one fast-import run instead of GitPython commits and heads
+    subprocess.run(["git", "init", "-q", "--bare"], cwd=remote_path, check=True)
+    stream = (
+        "commit refs/heads/master\n"
+        "mark :1\n"
+        "committer Test User <test@example.com> 1700000000 +0000\n"
+        "data 14\nInitial commit\n\n"
+        "reset refs/heads/feature/remote-only\nfrom :1\n\n"
+        "reset refs/heads/feature/both\nfrom :1\n\n"
+    )
+    subprocess.run(["git", "fast-import", "--quiet"], input=stream, text=True, cwd=remote_path, check=True)
     
-    # Fetch in local to see it
-    local_repo.remotes.origin.fetch()
+    # Clone to local: no transport negotiation, and --shared borrows the remote's objects
+    # through alternates instead of copying them (the remote outlives the clone here)
+    subprocess.run(["git", "clone", "-q", "--local", "--shared", "-b", "master", remote_path, local_path], check=True)
     
-    # Now create local tracking branch for 'feature/both'
-    local_repo.create_head("feature/both", "origin/feature/both")
+    # Create a local branch that is NOT on remote, and a local branch for 'feature/both'
+    # so it exists on both sides; both refs are written in one update-ref transaction
+    subprocess.run(
+        ["git", "update-ref", "--stdin"],
+        input="create refs/heads/feature/local-only HEAD\n"
+              "create refs/heads/feature/both refs/remotes/origin/feature/both\n",
+        text=True, cwd=local_path, check=True
+    )
 
-    # Set commit dates to be OLD (e.g. 60 days ago) so they are picked up
-    # We can't easily change commit date without rewriting history, but we can set days_limit to -1 or 0.
-    # If we set days_limit to 0, any branch created just now (age 0 days) might be borderline.
-    # Let's use days_limit = -1 to ensure everything is "older".
+    # The commit is dated 2023, so every branch is old enough; days_limit = -1 also keeps
+    # the check independent of commit dates.
     
     app = MockBranchCleanerApp(local_path)
     app.query_branches("feature/", -1)
@@ -126,9 +104,3 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
-    finally:
-        if os.path.exists("verify_repo_test"):
-            try:
-                shutil.rmtree("verify_repo_test")
-            except:
-                pass
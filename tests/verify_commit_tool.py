@@ -1,6 +1,8 @@
 
+import atexit
 import os
 import shutil
+import tempfile
 import subprocess
 import sys
 
@@ -8,10 +10,9 @@ def run_git(args, cwd):
     return subprocess.check_output(["git"] + args, cwd=cwd, text=True).strip()
 
 def verify_commit_tool():
-    base_path = os.path.abspath("commit_tool_test")
-    if os.path.exists(base_path):
-        shutil.rmtree(base_path)
-    os.makedirs(base_path)
+    # Fresh directory under the system temp dir (point TMPDIR at a RAM disk for faster runs)
+    base_path = tempfile.mkdtemp(prefix="commit_tool_test_")
+    atexit.register(shutil.rmtree, base_path, ignore_errors=True)
     
     # 1. Setup Repo
     print("Setting up test repo...")
@@ -74,9 +75,3 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
-    finally:
-        if os.path.exists("commit_tool_test"):
-            try:
-                shutil.rmtree("commit_tool_test")
-            except:
-                pass
@@ -1,96 +1,102 @@
 
-import os
+import atexit
 import shutil
+import tempfile
 import subprocess
 import sys
 
 def run_git(args, cwd):
     return subprocess.check_output(["git"] + args, cwd=cwd, text=True).strip()
 
+def fast_import(commits, cwd):
+    """
+    Create commits with a single `git fast-import` run instead of an add/commit per commit.
+    Each commit is (ref, message, {path: content}, parent): parent is the index of an earlier
+    commit to branch from, or None to continue the ref (or start it as a root commit).
+    """
+    stream = []
+    for number, (ref, message, changes, parent) in enumerate(commits):
+        identity = "Test User <test@example.com> %d +0000" % (1700000000 + number)
+        msg = message.encode()
+        stream.append(b"commit %s\nmark :%d\nauthor %s\ncommitter %s\ndata %d\n%s\n"
+                      % (ref.encode(), number + 1, identity.encode(), identity.encode(), len(msg), msg))
+        if parent is not None:
+            stream.append(b"from :%d\n" % (parent + 1))
+        for path, content in changes.items():
+            data = content.encode()
+            stream.append(b"M 644 inline %s\ndata %d\n%s\n" % (path.encode(), len(data), data))
+        stream.append(b"\n")
+    subprocess.run(["git", "fast-import", "--quiet"], input=b"".join(stream), cwd=cwd, check=True)
+
 def verify_pr_preview():
-    base_path = os.path.abspath("pr_preview_test")
-    if os.path.exists(base_path):
-        shutil.rmtree(base_path)
-    os.makedirs(base_path)
+    # Fresh directory under the system temp dir (point TMPDIR at a RAM disk for faster runs)
+    base_path = tempfile.mkdtemp(prefix="pr_preview_test_")
+    atexit.register(shutil.rmtree, base_path, ignore_errors=True)
     
     # 1. Setup Repo
     print("Setting up test repo...")
     run_git(["init"], base_path)
     
-    # Create main branch with initial commit
-    with open(os.path.join(base_path, "README.md"), "w") as f:
-        f.write("# Main\n")
-    run_git(["add", "README.md"], base_path)
-    run_git(["commit", "-m", "Initial commit"], base_path)
-
-    # Determine target branch name
+    # Initial commit, then one more commit on master (so the `..` logic is tested)
+    # and two on feature/test, all written by one git process
     target = "master"
-    branches = run_git(["branch"], base_path)
-    if "main" in branches:
-        target = "main"
-
-    # Create feature branch and switch to it
-    run_git(["checkout", "-b", "feature/test"], base_path)
-    
-    # Go back to master and add another commit to ensure `..` logic is tested
-    run_git(["checkout", target], base_path)
-    with open(os.path.join(base_path, "OTHER.md"), "w") as f:
-        f.write("# Other\n")
-    run_git(["add", "OTHER.md"], base_path)
-    run_git(["commit", "-m", "Add other file to master"], base_path)
-    run_git(["checkout", "feature/test"], base_path) # Go back to feature branch
-
-    # Modify README
-    with open(os.path.join(base_path, "README.md"), "a") as f:
-        f.write("Feature change\n")
-    run_git(["add", "README.md"], base_path)
-    run_git(["commit", "-m", "Update README"], base_path)
-    
-    # Add new file
-    with open(os.path.join(base_path, "new_file.py"), "w") as f:
-        f.write("print('hello')\n")
-    run_git(["add", "new_file.py"], base_path)
-    run_git(["commit", "-m", "Add new file"], base_path)
+    fast_import([
+        (f"refs/heads/{target}", "Initial commit", {"README.md": "# Main\n"}, None),
+        (f"refs/heads/{target}", "Add other file to master", {"OTHER.md": "# Other\n"}, None),
+        ("refs/heads/feature/test", "Update README", {"README.md": "# Main\nFeature change\n"}, 0),
+        ("refs/heads/feature/test", "Add new file", {"new_file.py": "print('hello')\n"}, None),
+    ], base_path)
     
     # 2. Simulate Logic in App
     source = "feature/test"
         
     print(f"Testing diff between {target} and {source}...")
     
-    # Test 1: Files Changed (git diff --stat)
+    # Commits come from git log, files from the net three-dot diff against the merge base.
     # Note: In app we try origin/target..source first, then target..source.
     # Here we only have local, so we test the fallback logic which is crucial.
-    
-    diff_cmd = ["diff", "--stat", f"{target}..{source}"]
-    stat_output = run_git(diff_cmd, base_path)
-    print("\n--- Diff Stat Output ---")
-    print(stat_output)
-    
-    if "README.md" in stat_output and "new_file.py" in stat_output:
-        print("SUCCESS: Files changed detected.")
+    marker = "\x01"
+    log_cmd = ["log", "-z", f"--pretty=format:{marker}%h%x00%an%x00%ai%x00%s", f"{target}..{source}"]
+    log_output = run_git(log_cmd, base_path)
+    print("\n--- Log Output ---")
+    print(log_output.replace("\0", " | "))
+
+    commits = []
+    tokens = iter(log_output.split("\0"))
+    for token in tokens:
+        if token.startswith(marker):
+            commits.append([token[len(marker):], next(tokens, ""), next(tokens, ""), next(tokens, "")])
+
+    diff_output = run_git(["diff", "-z", "--numstat", f"{target}...{source}"], base_path)
+    files = {}
+    for entry in diff_output.split("\0"):
+        parts = entry.split("\t")
+        if len(parts) == 3:
+            files[parts[2]] = [int(parts[0]), int(parts[1])]
+
+    # Test 1: Files Changed
+    if "README.md" in files and "new_file.py" in files and "OTHER.md" not in files:
+        print(f"SUCCESS: Files changed detected: {files}")
     else:
-        print("FAILURE: Files changed NOT detected.")
+        print(f"FAILURE: Files changed NOT detected correctly: {files}")
         sys.exit(1)
 
-    # Test 2: Commits (git log)
-    log_cmd = ["log", "--pretty=format:%h|%an|%ai|%s", f"{target}..{source}"]
-    log_output = run_git(log_cmd, base_path)
-    print("\n--- Log Output ---")
-    print(log_output)
-    
-    commits = log_output.splitlines()
+    if files["README.md"] != [1, 0] or files["new_file.py"] != [1, 0]:
+        print(f"FAILURE: Unexpected line counts: {files}")
+        sys.exit(1)
+
+    # Test 2: Commits
     if len(commits) == 2:
         print(f"SUCCESS: Found {len(commits)} commits (expected 2).")
 
         # Verify format of each commit line
-        for line in commits:
-            parts = line.split('|')
+        for parts in commits:
             if len(parts) != 4 or not parts[2].strip():
-                print(f"FAILURE: Commit line has incorrect format or missing date: {line}")
+                print(f"FAILURE: Commit record has incorrect format or missing date: {parts}")
                 sys.exit(1)
         print("SUCCESS: All commits have the correct format including a date.")
 
-        if "Update README" in commits[1] and "Add new file" in commits[0]:
+        if commits[1][3] == "Update README" and commits[0][3] == "Add new file":
              print("SUCCESS: Commit subjects match.")
         else:
              print("FAILURE: Commit subjects do not match expected order/content.")
@@ -106,9 +112,3 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
-    finally:
-        if os.path.exists("pr_preview_test"):
-            try:
-                shutil.rmtree("pr_preview_test")
-            except:
-                pass
@@ -3,9 +3,12 @@ import unittest
 import os
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 # Add project root to sys.path to allow importing from apps
 import sys
@@ -18,62 +21,81 @@ class TestPropagatorOrder(unittest.TestCase):
     Test suite for verifying the chronological order of cherry-picking multiple commits.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one hidden Tk root for all tests; starting Tcl/Tk per test is slow."""
+        cls.root = tk.Tk()
+        cls.root.withdraw()
+        # Test repos are deleted in the background so the next test doesn't wait on rmtree
+        cls.cleanup_pool = ThreadPoolExecutor(max_workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+        cls.cleanup_pool.shutdown(wait=True)
+
     def setUp(self):
         """Set up a temporary Git repository for testing."""
-        self.repo_path = Path("./test_repo_propagator").resolve()
-        if self.repo_path.exists():
-            shutil.rmtree(self.repo_path)
-        self.repo_path.mkdir()
+        # Fresh directory under the system temp dir (point TMPDIR at a RAM disk for faster runs)
+        self.repo_path = Path(tempfile.mkdtemp(prefix="test_repo_propagator_"))
 
         self.run_git_command("init", self.repo_path)
-        self.run_git_command("config user.name 'Test User'", self.repo_path)
-        self.run_git_command("config user.email 'test@example.com'", self.repo_path)
-
-        # Initial commit on main
-        (self.repo_path / "file.txt").write_text("initial")
-        self.run_git_command("add .", self.repo_path)
-        self.run_git_command("commit -m 'Initial commit'", self.repo_path)
-
-        # Create a feature branch with multiple commits
-        self.run_git_command("checkout -b feature", self.repo_path)
-
-        (self.repo_path / "file.txt").write_text("change 1")
-        self.run_git_command("commit -am 'Commit 1'", self.repo_path)
-        self.commit1_hash = self.get_latest_commit_hash()
-
-        (self.repo_path / "file.txt").write_text("change 2")
-        self.run_git_command("commit -am 'Commit 2'", self.repo_path)
-        self.commit2_hash = self.get_latest_commit_hash()
-
-        (self.repo_path / "file.txt").write_text("change 3")
-        self.run_git_command("commit -am 'Commit 3'", self.repo_path)
-        self.commit3_hash = self.get_latest_commit_hash()
+        # Identity for the commits the propagator makes; written directly instead of two `git config` calls
+        with open(self.repo_path / ".git" / "config", "a") as f:
+            f.write("[user]\n\tname = Test User\n\temail = test@example.com\n")
+
+        # Initial commit on master and three commits on feature, created by a single git process
+        self.fast_import([
+            ("refs/heads/master", "Initial commit", "initial"),
+            ("refs/heads/feature", "Commit 1", "change 1"),
+            ("refs/heads/feature", "Commit 2", "change 2"),
+            ("refs/heads/feature", "Commit 3", "change 3"),
+        ])
+        self.commit3_hash, self.commit2_hash, self.commit1_hash = self.run_git_command(
+            "rev-parse feature feature~1 feature~2", self.repo_path).splitlines()
 
         # Commits from git log are newest to oldest
         self.chronological_commits = [self.commit1_hash, self.commit2_hash, self.commit3_hash]
         self.log_order_commits = [self.commit3_hash, self.commit2_hash, self.commit1_hash]
 
         # Create target branch
-        self.run_git_command("checkout master", self.repo_path)
-        self.run_git_command("checkout -b target", self.repo_path)
+        self.run_git_command("checkout -b target master", self.repo_path)
 
-        # Set up a minimal Tkinter environment for the app
-        self.root = tk.Tk()
-        self.app = GitPropagatorApp(self.root)
+        # Give each test a fresh app in its own frame of the shared root
+        self.frame = tk.Frame(self.root)
+        self.app = GitPropagatorApp(self.frame)
         self.app.repo_path.set(str(self.repo_path))
 
     def tearDown(self):
-        """Clean up the temporary repository and Tkinter window."""
-        self.root.destroy()
-        shutil.rmtree(self.repo_path)
+        """Clean up the temporary repository and the test's app widgets."""
+        self.frame.destroy()
+        # Every test has its own directory, so it can be deleted while the next test runs
+        self.cleanup_pool.submit(shutil.rmtree, self.repo_path, ignore_errors=True)
 
     def run_git_command(self, command, cwd):
         """Helper to run a git command."""
         return subprocess.check_output(f"git {command}", shell=True, cwd=cwd, text=True).strip()
 
-    def get_latest_commit_hash(self):
-        """Helper to get the hash of the latest commit."""
-        return self.run_git_command("rev-parse HEAD", self.repo_path)
+    def fast_import(self, commits):
+        """
+        Helper to create commits with one `git fast-import` run instead of an add/commit per commit.
+        Each (ref, message, content) writes file.txt; a commit continues from the previous one.
+        """
+        stream = []
+        parent = None
+        for number, (ref, message, content) in enumerate(commits):
+            blob_mark, commit_mark = 2 * number + 1, 2 * number + 2
+            data = content.encode()
+            stream.append(b"blob\nmark :%d\ndata %d\n%s\n" % (blob_mark, len(data), data))
+            identity = b"Test User <test@example.com> %d +0000" % (1700000000 + number)
+            msg = message.encode()
+            stream.append(b"commit %s\nmark :%d\nauthor %s\ncommitter %s\ndata %d\n%s\n"
+                          % (ref.encode(), commit_mark, identity, identity, len(msg), msg))
+            if parent:
+                stream.append(b"from :%d\n" % parent)
+            stream.append(b"M 644 :%d file.txt\n\n" % blob_mark)
+            parent = commit_mark
+        subprocess.run(["git", "fast-import", "--quiet"], input=b"".join(stream), cwd=self.repo_path, check=True)
 
     def get_commit_hashes_on_branch(self, branch):
         """Helper to get the list of commit hashes on a branch, from oldest to newest."""
@@ -87,29 +109,22 @@ class TestPropagatorOrder(unittest.TestCase):
         Verify that multiple individual commits are cherry-picked in chronological order.
         """
         # --- Simulate UI state ---
-        # 1. Mock the commit listbox to return selected commit info
-        self.app.commit_listbox = MagicMock()
-        self.app.commit_listbox.curselection.return_value = (0, 1, 2) # User selects all three
-
-        # The get method should return commits in the order they appear in the log (newest first)
+        # Plain stubs for the widgets propagate_commit reads (it only calls curselection/get)
+        # 1. Stub the commit listbox: the user selects all three commits.
+        # get() returns commits in the order they appear in the log (newest first)
         commit_info_list = [
             f"{self.commit3_hash}|Commit 3 (Test User)",
             f"{self.commit2_hash}|Commit 2 (Test User)",
             f"{self.commit1_hash}|Commit 1 (Test User)",
         ]
-        self.app.commit_listbox.get.side_effect = lambda i: commit_info_list[i]
-
-        # 2. Mock the target branch listbox
-        self.app.target_branch_listbox = MagicMock()
-        self.app.target_branch_listbox.curselection.return_value = (0,)
-        self.app.target_branch_listbox.get.return_value = "target"
+        self.app.commit_listbox = SimpleNamespace(curselection=lambda: (0, 1, 2), get=lambda i: commit_info_list[i])
 
-        # 3. Mock other UI variables
-        self.app.combine_commits_var = MagicMock()
-        self.app.combine_commits_var.get.return_value = False # Individual commits
+        # 2. Stub the target branch listbox
+        self.app.target_branch_listbox = SimpleNamespace(curselection=lambda: (0,), get=lambda i: "target")
 
-        self.app.push_changes_var = MagicMock()
-        self.app.push_changes_var.get.return_value = False # No push
+        # 3. Stub other UI variables
+        self.app.combine_commits_var = SimpleNamespace(get=lambda: False) # Individual commits
+        self.app.push_changes_var = SimpleNamespace(get=lambda: False) # No push
 
         # --- Run the propagation logic ---
         self.app.propagate_commit()
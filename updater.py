@@ -11,13 +11,80 @@ import shutil
 import zipfile
 from pathlib import Path
 
+# How long to wait for the app to exit; it first waits for the user to dismiss its "Update Ready" message
+APP_EXIT_TIMEOUT = 120
+# How long to keep retrying the move of the old executable once the app is gone
+RENAME_TIMEOUT = 15
+# Block size for copying files out of the update ZIP (extractall copies in much smaller chunks)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def wait_for_process_exit(pid, timeout):
+    """Block until the process has exited or timeout seconds have passed. Returns True if it exited."""
+    if sys.platform == 'win32':
+        import ctypes
+        SYNCHRONIZE = 0x00100000
+        WAIT_OBJECT_0 = 0
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return True  # Already gone
+        try:
+            # Woken by the OS as soon as the process ends, no polling
+            return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == WAIT_OBJECT_0
+        finally:
+            kernel32.CloseHandle(handle)
+
+    # POSIX: the app is not our child, so check it with a short, growing interval
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass  # Still running under another user
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
+
+def extract_member(zip_ref, info, app_dir, mode=None):
+    """
+    Extract one ZIP entry below app_dir, copying it in COPY_BUFFER_SIZE blocks.
+    If mode is given it is applied too (through the open descriptor for files).
+    Returns the extracted path, or None for an entry that would land outside app_dir.
+    """
+    target = app_dir / info.filename
+    app_root = app_dir.resolve()
+    resolved = target.resolve()
+    if resolved != app_root and app_root not in resolved.parents:
+        print(f"Skipping unsafe path in update: {info.filename}")
+        return None
+
+    if info.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        if mode is not None:
+            os.chmod(target, mode)
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zip_ref.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        if mode is not None:
+            os.fchmod(dst.fileno(), mode)
+    return target
+
+
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: updater <current_exe_path> <downloaded_zip_path>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: updater <current_exe_path> <downloaded_zip_path> [<app_pid>]")
         sys.exit(1)
     
     current_exe = Path(sys.argv[1])
     downloaded_zip = Path(sys.argv[2])
+    app_pid = int(sys.argv[3]) if len(sys.argv) == 4 else None
 
     # Resolve correct app directory.
     # If .app bundle, current_exe might be inside Contents/MacOS
@@ -34,46 +101,50 @@ def main():
     app_dir = current_exe.parent
     
     print(f"Waiting for main application to close...")
-    time.sleep(2)  # Give main app time to close
+    if app_pid is not None:
+        if not wait_for_process_exit(app_pid, APP_EXIT_TIMEOUT):
+            print("Main application is still running; trying to replace it anyway...")
+    else:
+        time.sleep(2)  # Older apps don't pass their PID: give them time to close
     
     # Platform-specific backup extension
     backup_suffix = '.exe.old' if sys.platform == 'win32' else '.old'
 
     # Ensure the current exe is not running
     # On Windows, we loop and rename. On POSIX, we can usually just rename/unlink even if running (but rename is safer).
-    max_retries = 10
+    # Retries start at 10ms and double up to 0.5s, so a lock that clears quickly costs almost nothing.
     temp_backup = current_exe.with_suffix(backup_suffix)
+    deadline = time.monotonic() + RENAME_TIMEOUT
+    delay = 0.01
 
-    for i in range(max_retries):
+    while True:
         try:
-            # Try to rename (will fail if file is locked on Windows)
-            if temp_backup.exists():
-                if temp_backup.is_dir():
-                    shutil.rmtree(temp_backup)
-                else:
-                    temp_backup.unlink()
-
-            # Use os.replace for atomic replacement if possible (Python 3.3+)
-            # But here we are moving the *current* exe to backup
-            # shutil.move or os.rename
-            os.rename(current_exe, temp_backup)
+            # Try to move the current exe to the backup (will fail if file is locked on Windows).
+            # os.replace overwrites an old backup file atomically; only a .app directory
+            # backup has to be removed first, since directories can't be replaced.
+            if temp_backup.is_dir():
+                shutil.rmtree(temp_backup)
+            os.replace(current_exe, temp_backup)
             break
+        except FileNotFoundError:
+             # Already gone?
+             break
         except PermissionError:
-            if i < max_retries - 1:
-                print(f"Waiting for executable to close... ({i+1}/{max_retries})")
-                time.sleep(1)
+            if time.monotonic() < deadline:
+                if delay == 0.01:
+                    print("Waiting for executable to close...")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
             else:
                 print("ERROR: Could not replace executable. Please close the application manually.")
                 if sys.platform == 'win32':
                     input("Press Enter to exit...")
                 sys.exit(1)
-        except FileNotFoundError:
-             # Already gone?
-             break
         except OSError as e:
              print(f"OS Error during rename: {e}")
-             if i < max_retries - 1:
-                time.sleep(1)
+             if time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
              else:
                 sys.exit(1)
 
@@ -90,45 +161,39 @@ def main():
         if current_updater.name.lower() == updater_name.lower():
             try:
                 updater_backup = current_updater.with_suffix(backup_suffix)
-                if updater_backup.exists():
-                    updater_backup.unlink()
 
-                # Rename running executable to .old
+                # Rename running executable to .old, overwriting any earlier backup
                 # Windows allows renaming running files, POSIX allows unlinking/renaming
-                os.rename(current_updater, updater_backup)
+                os.replace(current_updater, updater_backup)
             except Exception as e:
                 print(f"Warning: Could not enable self-update: {e}")
         
         # Extract ZIP contents
         # On Mac, if it's a .app bundle, unzip preserves directory structure
         with zipfile.ZipFile(downloaded_zip, 'r') as zip_ref:
-            # On Unix, we might need to preserve permissions (chmod +x)
-            # zipfile.extractall doesn't always preserve permissions
-            zip_ref.extractall(app_dir)
-            
-            # Restore permissions for executables on Unix
-            if sys.platform != 'win32':
-                for info in zip_ref.infolist():
-                    extracted_path = app_dir / info.filename
-                    # Check if it was executable (external_attr >> 16)
-                    # 0o755 is rwxr-xr-x
-                    # ZIP external_attr:
-                    # Unix attributes are in the high order 16 bits
+            # The main executable, by its ZIP name: inside a .app bundle the binary is
+            # Contents/MacOS/<App> by convention, otherwise it has the current exe's name
+            if current_exe.name.endswith('.app'):
+                main_binary_suffix = f"/Contents/MacOS/{current_exe.stem}"
+            else:
+                main_binary_suffix = None
+
+            # Entries are copied in 1 MiB blocks, and on Unix permissions are restored
+            # through the open file as it is written (zipfile doesn't preserve them)
+            for info in zip_ref.infolist():
+                mode = None
+                if sys.platform != 'win32':
+                    # Unix attributes are in the high order 16 bits of external_attr.
+                    # Only entries with execute bits (executables, directories) need a chmod;
+                    # everything else is already created readable/writable.
                     unix_mode = info.external_attr >> 16
-                    if unix_mode:
-                        os.chmod(extracted_path, unix_mode)
-
-                    # Ensure the main executable is executable if detection fails
-                    # If we extracted a .app, we need to chmod the binary inside
-                    if current_exe.name.endswith('.app'):
-                        # Try to find binary inside .app
-                        # Convention: App.app/Contents/MacOS/App
-                        app_name = current_exe.stem
-                        binary_path = extracted_path
-                        if binary_path.name == app_name and 'Contents/MacOS' in str(binary_path):
-                             os.chmod(binary_path, 0o755)
-                    elif extracted_path.name == current_exe.name:
-                         os.chmod(extracted_path, 0o755)
+                    if unix_mode & 0o111:
+                        mode = unix_mode & 0o7777
+                    elif (info.filename.endswith(main_binary_suffix) if main_binary_suffix
+                          else info.filename == current_exe.name):
+                        # Ensure the main executable is executable if the ZIP lost its mode
+                        mode = 0o755
+                extract_member(zip_ref, info, app_dir, mode)
 
         print(f"Successfully updated to new version!")
         
@@ -181,15 +246,20 @@ def main():
         print(f"ERROR during update: {e}")
         # Restore backup if something went wrong
         if temp_backup.exists():
+            # Move the partial new version aside with one rename, so the backup
+            # goes back right away; a failed .app is only deleted afterwards
+            failed_exe = current_exe.with_name(current_exe.name + '.failed')
             if current_exe.exists():
-                 # Should probably unlink partial new file first
                  try:
                     if current_exe.is_dir():
-                        shutil.rmtree(current_exe)
+                        shutil.rmtree(failed_exe, ignore_errors=True)
+                        os.replace(current_exe, failed_exe)
                     else:
                         current_exe.unlink()
-                 except: pass
-            temp_backup.rename(current_exe)
+                 except OSError: pass
+            os.replace(temp_backup, current_exe)
+            if failed_exe.is_dir():
+                shutil.rmtree(failed_exe, ignore_errors=True)
 
             # Restore permissions
             if sys.platform != 'win32':
@@ -2,22 +2,29 @@
 Shared Git utility functions used across multiple apps.
 """
 
+import os
 import subprocess
 import shlex
 import sys
 
+# Hide console window when running as frozen executable on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
 
-def run_git_command(command, repo_path, check=True):
+
+def run_git_command(command, repo_path, check=True, text=True):
     """
     Execute a git command in the specified repository.
     
     Args:
-        command (str): Git command without 'git' prefix (e.g., "branch -a")
+        command (str | list[str]): Git command without 'git' prefix, either as a string
+            (e.g., "branch -a") or as an argument list (e.g., ["branch", "-a"]).
+            Lists are passed through as-is, so paths and branch names need no quoting.
         repo_path (str): Path to the Git repository
         check (bool): Whether to raise exception on non-zero exit code
+        text (bool): Decode stdout; with False the raw, unstripped bytes are returned
         
     Returns:
-        str: stdout from the command
+        str | bytes: stdout from the command
         
     Raises:
         subprocess.CalledProcessError: If command fails and check=True
@@ -25,27 +32,22 @@ def run_git_command(command, repo_path, check=True):
     if not repo_path:
         raise ValueError("Repository path not set.")
     
-    command_parts = ["git"] + shlex.split(command)
-    
-    # Hide console window when running as frozen executable on Windows
-    creation_flags = 0
-    if sys.platform == 'win32':
-        creation_flags = subprocess.CREATE_NO_WINDOW
+    if isinstance(command, str):
+        command = shlex.split(command)
     
+    decode_options = {'text': True, 'encoding': 'utf-8', 'errors': 'ignore'} if text else {}
     process = subprocess.run(
-        command_parts,
+        ["git", *command],
         cwd=repo_path,
         capture_output=True,
-        text=True,
-        encoding='utf-8',
-        errors='ignore',
-        creationflags=creation_flags
+        creationflags=_CREATION_FLAGS,
+        **decode_options
     )
     
     if check:
         process.check_returncode()
     
-    return process.stdout.strip()
+    return process.stdout.strip() if text else process.stdout
 
 
 def get_branches(repo_path):
@@ -58,14 +60,10 @@ def get_branches(repo_path):
     Returns:
         list[str]: Sorted list of branch names
     """
-    branch_output = run_git_command("branch", repo_path)
-    branches = []
-    for line in branch_output.splitlines():
-        branch = line.strip()
-        if branch.startswith("* ") or branch.startswith("+ "):
-            branch = branch[2:]
-        branches.append(branch)
-    return sorted(branches)
+    # for-each-ref prints bare names without "* "/"+ " markers, already sorted by refname
+    return run_git_command(
+        ["for-each-ref", "--format=%(refname:short)", "refs/heads/"], repo_path
+    ).splitlines()
 
 
 def get_current_branch(repo_path):
@@ -78,7 +76,23 @@ def get_current_branch(repo_path):
     Returns:
         str: Current branch name
     """
-    return run_git_command("rev-parse --abbrev-ref HEAD", repo_path)
+    # HEAD is normally "ref: refs/heads/<name>", so read it instead of starting git
+    git_dir = os.path.join(repo_path, '.git')
+    try:
+        if os.path.isfile(git_dir):
+            # Linked worktree or submodule: ".git" holds "gitdir: <path>"
+            with open(git_dir, encoding='utf-8') as f:
+                pointer = f.read().strip()
+            if pointer.startswith('gitdir: '):
+                git_dir = os.path.join(repo_path, pointer[len('gitdir: '):])
+        with open(os.path.join(git_dir, 'HEAD'), encoding='utf-8') as f:
+            head = f.read().strip()
+        if head.startswith('ref: refs/heads/'):
+            return head[len('ref: refs/heads/'):]
+    except OSError:
+        pass
+    # Detached HEAD, subdirectory of a repo, or anything unusual: let git decide
+    return run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], repo_path)
 
 
 def get_commit_info(repo_path, branch, max_commits=50):
@@ -93,11 +107,15 @@ def get_commit_info(repo_path, branch, max_commits=50):
     Returns:
         list[str]: List of commit info strings in format "hash|message (author)"
     """
+    # -z separates the entries with NUL, so one bytes split replaces line splitting
     log_output = run_git_command(
-        f"log {branch} --pretty=format:'%h|%s (%an)' -n {max_commits}",
-        repo_path
+        ["log", "-z", branch, "--pretty=format:%h|%s (%an)", "-n", str(max_commits)],
+        repo_path,
+        text=False
     )
-    return log_output.splitlines()
+    if not log_output:
+        return []
+    return [entry.decode('utf-8', 'replace') for entry in log_output.split(b'\0')]
 
 
 def get_tracking_branch(repo_path, branch_name):
@@ -113,7 +131,7 @@ def get_tracking_branch(repo_path, branch_name):
     """
     try:
         tracking = run_git_command(
-            f"rev-parse --abbrev-ref {branch_name}@{{upstream}}",
+            ["rev-parse", "--abbrev-ref", f"{branch_name}@{{upstream}}"],
             repo_path,
             check=False
         )
@@ -133,8 +151,21 @@ def has_uncommitted_changes(repo_path):
         bool: True if there are uncommitted changes, False otherwise
     """
     try:
-        status_output = run_git_command("status --porcelain", repo_path)
-        return bool(status_output.strip())
+        # Only a yes/no is needed: stop at the first byte instead of reading the whole listing
+        process = subprocess.Popen(
+            ["git", "status", "--porcelain", "-z"],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=_CREATION_FLAGS
+        )
+        with process:
+            dirty = bool(process.stdout.read(1))
+            if dirty:
+                process.kill()
+            elif process.wait() != 0:
+                return True
+        return dirty
     except Exception:
         return True  # Assume dirty state on error for safety
 
@@ -153,7 +184,7 @@ def get_branches_with_tracking(repo_path):
         # Use git for-each-ref to get all branches and their tracking in ONE command
         # Format: local_branch|tracking_branch (e.g., "develop|origin/develop")
         output = run_git_command(
-            "for-each-ref --format='%(refname:short)|%(upstream:short)' refs/heads/",
+            ["for-each-ref", "--format=%(refname:short)|%(upstream:short)", "refs/heads/"],
             repo_path
         )
         
@@ -171,6 +202,38 @@ def get_branches_with_tracking(repo_path):
         return []
 
 
+def get_repo_snapshot(repo_path):
+    """
+    Get local branches, the current branch and their tracking branches from a single git call.
+    Use this instead of calling get_branches, get_current_branch and get_tracking_branch
+    one after another.
+    
+    Args:
+        repo_path (str): Path to the Git repository
+        
+    Returns:
+        dict: {'branches': sorted list of branch names,
+               'current': current branch name, or None when HEAD is detached,
+               'tracking': {branch: remote tracking branch or None}}
+    """
+    # %(HEAD) is "*" for the checked-out branch and " " otherwise (the output is stripped,
+    # so the marker has its own field rather than relying on the leading space)
+    output = run_git_command(
+        ["for-each-ref", "--format=%(HEAD)|%(refname:short)|%(upstream:short)", "refs/heads/"],
+        repo_path
+    )
+    
+    current = None
+    tracking = {}
+    for line in output.splitlines():
+        marker, branch, upstream = line.split('|', 2)
+        if marker.strip() == '*':
+            current = branch
+        tracking[branch] = upstream or None
+    
+    return {'branches': sorted(tracking), 'current': current, 'tracking': tracking}
+
+
 def list_worktrees(repo_path):
     """
     List all worktrees for a repository.
@@ -178,7 +241,7 @@ def list_worktrees(repo_path):
     Returns:
         list[dict]: Each dict has 'path', 'head', 'branch' keys.
     """
-    output = run_git_command("worktree list --porcelain", repo_path)
+    output = run_git_command(["worktree", "list", "--porcelain"], repo_path)
     worktrees = []
     current = {}
     
@@ -206,45 +269,25 @@ def list_worktrees(repo_path):
 def add_worktree(repo_path, worktree_path, branch, create_branch=False):
     """
     Add a new worktree.
-    Uses subprocess directly to avoid shlex.split issues with quoted paths.
+    Passes an argument list, so quoted paths never go through shlex.split.
     """
-    cmd = ["git", "worktree", "add"]
+    cmd = ["worktree", "add"]
     if create_branch:
         cmd += ["-b", branch, worktree_path]
     else:
         cmd += [worktree_path, branch]
-    
-    creation_flags = 0
-    if sys.platform == 'win32':
-        creation_flags = subprocess.CREATE_NO_WINDOW
-    
-    process = subprocess.run(
-        cmd, cwd=repo_path, capture_output=True, text=True,
-        encoding='utf-8', errors='ignore', creationflags=creation_flags
-    )
-    process.check_returncode()
-    return process.stdout.strip()
+    return run_git_command(cmd, repo_path)
 
 
 def remove_worktree(repo_path, worktree_path, force=False):
-    """Remove a worktree. Uses subprocess directly for path safety."""
-    cmd = ["git", "worktree", "remove"]
+    """Remove a worktree. Passes an argument list for path safety."""
+    cmd = ["worktree", "remove"]
     if force:
         cmd.append("--force")
     cmd.append(worktree_path)
-    
-    creation_flags = 0
-    if sys.platform == 'win32':
-        creation_flags = subprocess.CREATE_NO_WINDOW
-    
-    process = subprocess.run(
-        cmd, cwd=repo_path, capture_output=True, text=True,
-        encoding='utf-8', errors='ignore', creationflags=creation_flags
-    )
-    process.check_returncode()
-    return process.stdout.strip()
+    return run_git_command(cmd, repo_path)
 
 
 def prune_worktrees(repo_path):
     """Prune stale worktree references."""
-    return run_git_command("worktree prune", repo_path)
+    return run_git_command(["worktree", "prune"], repo_path)
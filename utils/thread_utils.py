@@ -0,0 +1,53 @@
+"""
+Shared threading helpers.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class DaemonExecutor:
+    """
+    A minimal ThreadPoolExecutor replacement whose workers are daemon threads.
+    concurrent.futures joins its own workers at interpreter exit, so closing the app
+    during a slow download or git call would wait for it; these workers are simply dropped.
+    Only submit() is provided; futures can be cancelled while they are still queued.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix=''):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix or 'daemon-worker'
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._idle = 0
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        self._queue.put((future, func, args, kwargs))
+        with self._lock:
+            if self._idle:
+                self._idle -= 1  # An idle worker will pick this one up
+            elif self._workers < self._max_workers:
+                self._workers += 1
+                threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{self._workers}",
+                    daemon=True
+                ).start()
+        return future
+
+    def _worker(self):
+        # A new worker is started for a queued task, so it only counts as idle once that is done
+        while True:
+            future, func, args, kwargs = self._queue.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                self._idle += 1
@@ -2,6 +2,24 @@
 Versioning utilities for comparing semantic version strings.
 """
 import sys
+from functools import lru_cache
+
+# major.minor.patch.build; shorter versions are zero-padded to this width when parsed
+VERSION_WIDTH = 4
+
+
+@lru_cache(maxsize=32)
+def parse_version(version):
+    """
+    Parses a version string into a tuple of ints (e.g., "v3.2.10-alpha" -> (3, 2, 10, 0)),
+    zero-padded to VERSION_WIDTH components so typical versions compare directly.
+    Results are cached, so repeated checks against the running version parse it once.
+    Raises ValueError/AttributeError for strings that are not in the expected format.
+    """
+    clean = version.strip().lstrip('v').partition('-')[0].partition('+')[0]
+    parts = tuple(map(int, clean.split('.')))
+    return parts + (0,) * (VERSION_WIDTH - len(parts))
+
 
 def is_newer_version(version1, version2):
     """
@@ -18,21 +36,17 @@ def is_newer_version(version1, version2):
         return False
 
     try:
-        # --- Pre-processing ---
-        v1_clean = version1.strip().lstrip('v').split('-')[0].split('+')[0]
-        v2_clean = version2.strip().lstrip('v').split('-')[0].split('+')[0]
-
-        v1_parts = list(map(int, v1_clean.split('.')))
-        v2_parts = list(map(int, v2_clean.split('.')))
+        v1_parts = parse_version(version1)
+        v2_parts = parse_version(version2)
 
     except (ValueError, AttributeError) as e:
         # Handle cases where version strings are not in the expected format
         print(f"Warning: Could not parse version string. Error: {e}. v1='{version1}', v2='{version2}'", file=sys.stderr)
         return False
 
-    # Pad the shorter version list with zeros for comparison
-    max_len = max(len(v1_parts), len(v2_parts))
-    v1_parts.extend([0] * (max_len - len(v1_parts)))
-    v2_parts.extend([0] * (max_len - len(v2_parts)))
+    if len(v1_parts) == len(v2_parts):
+        return v1_parts > v2_parts
 
-    return v1_parts > v2_parts
+    # More than VERSION_WIDTH components on one side: pad the shorter one
+    max_len = max(len(v1_parts), len(v2_parts))
+    return v1_parts + (0,) * (max_len - len(v1_parts)) > v2_parts + (0,) * (max_len - len(v2_parts))